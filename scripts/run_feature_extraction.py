@@ -10,32 +10,12 @@ import typer
 
 from startuplens.config import get_settings
 from startuplens.db import execute_query, get_connection, refresh_matview
-from startuplens.feature_store.extractors import (
-    extract_campaign_features,
-    extract_company_features,
-    extract_evidence_features,
-    extract_financial_features,
-    extract_market_regime_features,
-    extract_regulatory_features,
-    extract_team_features,
-    extract_terms_features,
-)
+from startuplens.feature_store.pipeline import run_extractors_bulk
 from startuplens.feature_store.store import write_features_batch
 
 logger = structlog.get_logger(__name__)
 app = typer.Typer()
 
-ALL_EXTRACTORS = [
-    ("campaign", extract_campaign_features),
-    ("company", extract_company_features),
-    ("financial", extract_financial_features),
-    ("team", extract_team_features),
-    ("terms", extract_terms_features),
-    ("regulatory", extract_regulatory_features),
-    ("market_regime", extract_market_regime_features),
-    ("evidence", extract_evidence_features),
-]
-
 
 @app.command()
 def main(
@@ -146,8 +126,9 @@ def main(
 
         logger.info("entities_to_process", count=len(entities))
         total_written = 0
+        extracted = run_extractors_bulk(entities)
 
-        for entity in entities:
+        for entity, features_by_family in zip(entities, extracted, strict=True):
             entity_id = entity["entity_id"]
             # Use campaign/filing date as as_of_date for temporal correctness
             entity_date = target_date
@@ -155,8 +136,7 @@ def main(
                 if entity.get(date_field):
                     entity_date = entity[date_field]
                     break
-            for family_name, extractor in ALL_EXTRACTORS:
-                features = extractor(entity)
+            for family_name, features in features_by_family.items():
                 count = write_features_batch(
                     conn, entity_id, features, entity_date,
                     source=f"extractor_{family_name}",
@@ -15,6 +15,7 @@ from startuplens.backtest.holdout import (
 )
 from startuplens.backtest.metrics import (
     MetricResult,
+    MetricResults,
     all_must_pass_met,
     compute_ece,
     evaluate_backtest,
@@ -22,6 +23,7 @@ from startuplens.backtest.metrics import (
 from startuplens.backtest.provenance import (
     compare_runs,
     get_backtest_run,
+    get_backtest_runs_bulk,
     get_latest_runs,
     get_passing_runs,
     log_backtest_run,
@@ -45,6 +47,7 @@ __all__ = [
     "split_entities_by_window",
     # metrics
     "MetricResult",
+    "MetricResults",
     "compute_ece",
     "evaluate_backtest",
     "all_must_pass_met",
@@ -67,6 +70,7 @@ __all__ = [
     # provenance
     "log_backtest_run",
     "get_backtest_run",
+    "get_backtest_runs_bulk",
     "get_latest_runs",
     "get_passing_runs",
     "compare_runs",
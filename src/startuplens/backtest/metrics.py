@@ -7,9 +7,12 @@ does not ship unless all "must pass" thresholds are met.
 from __future__ import annotations
 
 import math
-from collections.abc import Sequence
+import operator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
 # ---------------------------------------------------------------------------
 # Metric result
 # ---------------------------------------------------------------------------
@@ -26,6 +29,36 @@ class MetricResult:
     failure_explanation: str = ""
 
 
+class MetricResults(Sequence[MetricResult]):
+    """Read-only metric results in evaluation order, also indexable by name.
+
+    Supports iteration, ``len`` and integer indexing like a tuple of
+    :class:`MetricResult`; additionally ``results["Survival AUC"]`` is a
+    single dict lookup instead of a scan.  The container is immutable, so
+    the name index built on construction can never go stale.
+    """
+
+    __slots__ = ("_by_name", "_results")
+
+    def __init__(self, results: Iterable[MetricResult] = ()) -> None:
+        self._results = tuple(results)
+        self._by_name = {r.name: r for r in self._results}
+
+    def __getitem__(self, key):  # type: ignore[override]
+        if isinstance(key, str):
+            return self._by_name[key]
+        return self._results[key]
+
+    def __iter__(self) -> Iterator[MetricResult]:
+        return iter(self._results)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._results)!r})"
+
+
 @dataclass
 class CalibrationBin:
     """One reliability bin from a calibration curve."""
@@ -43,6 +76,36 @@ class CalibrationBin:
 # ECE (Expected Calibration Error)
 # ---------------------------------------------------------------------------
 
+def _bin_sums(
+    y_true: Sequence[int],
+    y_pred_proba: Sequence[float],
+    n_bins: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-bin sample counts, summed predictions and summed labels.
+
+    Bins are equally spaced on [0, 1], lower-inclusive and upper-exclusive
+    except the last, which also takes ``p == 1.0``.  Predictions outside
+    [0, 1] (and NaN) fall in no bin.
+    """
+    pred = np.asarray(y_pred_proba, dtype=np.float64)
+    true = np.asarray(y_true, dtype=np.float64)
+    boundaries = np.arange(n_bins + 1) / n_bins  # same floats as i / n_bins
+
+    # Well-formed probabilities (the usual case) need no masking copies.
+    # NaN compares False both ways, so it is dropped here too.
+    in_range = (pred >= 0.0) & (pred <= 1.0)
+    if not in_range.all():
+        pred, true = pred[in_range], true[in_range]
+
+    idx = np.searchsorted(boundaries, pred, side="right") - 1
+    np.minimum(idx, n_bins - 1, out=idx)
+
+    counts = np.bincount(idx, minlength=n_bins)
+    sum_pred = np.bincount(idx, weights=pred, minlength=n_bins)
+    sum_true = np.bincount(idx, weights=true, minlength=n_bins)
+    return counts, sum_pred, sum_true
+
+
 def compute_ece(
     y_true: Sequence[int],
     y_pred_proba: Sequence[float],
@@ -73,27 +136,10 @@ def compute_ece(
     if len(y_true) == 0:
         return 0.0
 
-    n = len(y_true)
-    bin_boundaries = [i / n_bins for i in range(n_bins + 1)]
-    ece = 0.0
-
-    for b in range(n_bins):
-        lo = bin_boundaries[b]
-        hi = bin_boundaries[b + 1]
-
-        # Collect indices in this bin (lower-inclusive, upper-exclusive except last bin)
-        indices = [
-            i for i, p in enumerate(y_pred_proba)
-            if (lo <= p < hi) or (b == n_bins - 1 and p == hi)
-        ]
-        if not indices:
-            continue
-
-        avg_confidence = sum(y_pred_proba[i] for i in indices) / len(indices)
-        avg_accuracy = sum(y_true[i] for i in indices) / len(indices)
-        ece += (len(indices) / n) * abs(avg_accuracy - avg_confidence)
-
-    return ece
+    counts, sum_pred, sum_true = _bin_sums(y_true, y_pred_proba, n_bins)
+    nz = counts > 0
+    gaps = np.abs(sum_true[nz] - sum_pred[nz])  # == count * |accuracy - confidence|
+    return float(gaps.sum() / len(y_true))
 
 
 def compute_calibration_bins(
@@ -107,40 +153,21 @@ def compute_calibration_bins(
     if n_bins <= 0:
         raise ValueError("n_bins must be positive")
 
-    boundaries = [i / n_bins for i in range(n_bins + 1)]
+    counts, sum_pred, sum_true = _bin_sums(y_true, y_pred_proba, n_bins)
     bins: list[CalibrationBin] = []
     for idx in range(n_bins):
-        lo = boundaries[idx]
-        hi = boundaries[idx + 1]
-        indices = [
-            i
-            for i, p in enumerate(y_pred_proba)
-            if (lo <= p < hi) or (idx == n_bins - 1 and p == hi)
-        ]
-        if not indices:
-            bins.append(
-                CalibrationBin(
-                    bin_index=idx,
-                    bin_lower=lo,
-                    bin_upper=hi,
-                    sample_size=0,
-                    mean_pred=None,
-                    observed_rate=None,
-                    abs_error=None,
-                ),
-            )
-            continue
-        mean_pred = sum(y_pred_proba[i] for i in indices) / len(indices)
-        observed = sum(y_true[i] for i in indices) / len(indices)
+        size = int(counts[idx])
+        mean_pred = float(sum_pred[idx] / size) if size else None
+        observed = float(sum_true[idx] / size) if size else None
         bins.append(
             CalibrationBin(
                 bin_index=idx,
-                bin_lower=lo,
-                bin_upper=hi,
-                sample_size=len(indices),
+                bin_lower=idx / n_bins,
+                bin_upper=(idx + 1) / n_bins,
+                sample_size=size,
                 mean_pred=mean_pred,
                 observed_rate=observed,
-                abs_error=abs(observed - mean_pred),
+                abs_error=abs(observed - mean_pred) if size else None,
             ),
         )
     return bins
@@ -150,148 +177,76 @@ def compute_calibration_bins(
 # Threshold definitions
 # ---------------------------------------------------------------------------
 
-def _survival_auc(value: float) -> MetricResult:
-    threshold = 0.65
-    return MetricResult(
-        name="Survival AUC",
-        value=value,
-        threshold=threshold,
-        passed=value >= threshold,
-        must_pass=True,
-        failure_explanation=(
-            "Model can't distinguish survivors from failures. "
-            "Investigate feature engineering."
-            if value < threshold else ""
-        ),
-    )
-
-
-def _calibration_ece(value: float) -> MetricResult:
-    threshold = 0.08
-    return MetricResult(
-        name="Calibration ECE",
-        value=value,
-        threshold=threshold,
-        passed=value < threshold,
-        must_pass=True,
-        failure_explanation=(
-            "Predicted probabilities unreliable. "
-            "Apply Platt scaling or investigate distribution shift."
-            if value >= threshold else ""
-        ),
-    )
-
-
-def _portfolio_quality_vs_random(value: float) -> MetricResult:
-    """Portfolio quality score ratio: model vs random.
-
-    Uses revenue-growth-weighted outcomes to differentiate quality among
-    survivors.  A ratio > 1.3 means the model picks companies whose
-    post-raise trajectory is 30%+ better than random selection.
-    """
-    threshold = 1.3
-    return MetricResult(
-        name="Portfolio quality vs random",
-        value=value,
-        threshold=threshold,
-        passed=value > threshold,
-        must_pass=True,
-        failure_explanation=(
-            "Signal isn't worth the complexity. "
-            "Model-selected portfolio must score 30%+ higher than random."
-            if value <= threshold else ""
-        ),
-    )
-
-
-def _portfolio_failure_rate_vs_random(value: float) -> MetricResult:
-    threshold = 0.7
-    return MetricResult(
-        name="Portfolio failure rate vs random",
-        value=value,
-        threshold=threshold,
-        passed=value < threshold,
-        must_pass=True,
-        failure_explanation=(
-            "Model must reduce failure exposure by 30%+ vs random."
-            if value >= threshold else ""
-        ),
-    )
-
-
-def _claude_text_score_auc(value: float) -> MetricResult:
-    threshold = 0.60
-    return MetricResult(
-        name="Claude text score AUC",
-        value=value,
-        threshold=threshold,
-        passed=value >= threshold,
-        must_pass=True,
-        failure_explanation=(
-            "Text analysis can't discriminate. "
-            "Reduce text weight from 20% or investigate prompt quality."
-            if value < threshold else ""
-        ),
-    )
-
-
-def _progress_auc(value: float) -> MetricResult:
-    threshold = 0.58
-    return MetricResult(
-        name="Progress AUC",
-        value=value,
-        threshold=threshold,
-        passed=value >= threshold,
-        must_pass=False,
-        failure_explanation=(
-            "18-month model adds no value. "
-            "Drop it or simplify to a heuristic."
-            if value < threshold else ""
-        ),
-    )
-
-
-def _abstention_rate(value: float) -> MetricResult:
-    """Model uncertainty rate: fraction of deals with P(fail) in [0.4, 0.6].
-
-    A good model should be decisive — most deals should get a clear
-    high or low probability, not cluster near 0.5.  An uncertainty rate
-    above 40% means the model can't distinguish most deals.
-    """
-    threshold = 0.40
-    return MetricResult(
-        name="Model uncertainty rate",
-        value=value,
-        threshold=threshold,
-        passed=value <= threshold,
-        must_pass=False,
-        failure_explanation=(
-            "Model is uncertain on too many deals. "
-            "Investigate feature quality or class balance."
-            if value > threshold else ""
-        ),
-    )
+@dataclass(slots=True, frozen=True)
+class MetricSpec:
+    """Static definition of one backtest threshold."""
 
+    name: str
+    threshold: float
+    passes: Callable[[float, float], bool]
+    must_pass: bool
+    failure_explanation: str
+
+    def evaluate(self, value: float) -> MetricResult:
+        passed = self.passes(value, self.threshold)
+        return MetricResult(
+            name=self.name,
+            value=value,
+            threshold=self.threshold,
+            passed=passed,
+            must_pass=self.must_pass,
+            # NaN values fail silently: there is nothing to explain yet.
+            failure_explanation="" if passed or math.isnan(value) else self.failure_explanation,
+        )
 
-def _sector_bias(max_sector_share: float) -> MetricResult:
-    """Sector concentration in top-K model-ranked deals.
 
-    Measures whether the model systematically favours one sector in its
-    top-ranked deals (e.g. top 50), independent of portfolio policy size.
-    A value above 0.50 means one sector dominates the model's picks.
-    """
-    threshold = 0.50
-    return MetricResult(
-        name="Top-K sector concentration",
-        value=max_sector_share,
-        threshold=threshold,
-        passed=max_sector_share <= threshold,
-        must_pass=False,
-        failure_explanation=(
-            "Model may be overfit to one sector's success pattern."
-            if max_sector_share > threshold else ""
-        ),
-    )
+# Built once at import; order matches the keyword arguments of evaluate_backtest.
+_METRIC_SPECS: tuple[MetricSpec, ...] = (
+    MetricSpec(
+        "Survival AUC", 0.65, operator.ge, True,
+        "Model can't distinguish survivors from failures. "
+        "Investigate feature engineering.",
+    ),
+    MetricSpec(
+        "Calibration ECE", 0.08, operator.lt, True,
+        "Predicted probabilities unreliable. "
+        "Apply Platt scaling or investigate distribution shift.",
+    ),
+    # Revenue-growth-weighted portfolio quality, model vs random.  A ratio
+    # > 1.3 means the model's picks trend 30%+ better than random selection.
+    MetricSpec(
+        "Portfolio quality vs random", 1.3, operator.gt, True,
+        "Signal isn't worth the complexity. "
+        "Model-selected portfolio must score 30%+ higher than random.",
+    ),
+    MetricSpec(
+        "Portfolio failure rate vs random", 0.7, operator.lt, True,
+        "Model must reduce failure exposure by 30%+ vs random.",
+    ),
+    MetricSpec(
+        "Claude text score AUC", 0.60, operator.ge, True,
+        "Text analysis can't discriminate. "
+        "Reduce text weight from 20% or investigate prompt quality.",
+    ),
+    MetricSpec(
+        "Progress AUC", 0.58, operator.ge, False,
+        "18-month model adds no value. "
+        "Drop it or simplify to a heuristic.",
+    ),
+    # Fraction of deals with P(fail) in [0.4, 0.6].  A decisive model keeps
+    # most deals away from 0.5; above 40% it can't distinguish most deals.
+    MetricSpec(
+        "Model uncertainty rate", 0.40, operator.le, False,
+        "Model is uncertain on too many deals. "
+        "Investigate feature quality or class balance.",
+    ),
+    # Largest single-sector share of the top-K model-ranked deals (e.g. top
+    # 50), independent of portfolio policy size.
+    MetricSpec(
+        "Top-K sector concentration", 0.50, operator.le, False,
+        "Model may be overfit to one sector's success pattern.",
+    ),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -308,27 +263,29 @@ def evaluate_backtest(
     progress_auc: float = math.nan,
     model_uncertainty_rate: float = math.nan,
     top_k_sector_concentration: float = math.nan,
-) -> list[MetricResult]:
+) -> MetricResults:
     """Evaluate all backtest metrics against their thresholds.
 
-    Returns a list of :class:`MetricResult` objects, one per metric.
+    Returns a read-only :class:`MetricResults` sequence with one
+    :class:`MetricResult` per metric, which can also be indexed by metric name.
     Metrics whose value is ``NaN`` are still included but automatically
-    marked as *not passed* (with an appropriate explanation) so callers
-    can inspect them.
+    marked as *not passed* so callers can inspect them.
     """
-    results: list[MetricResult] = [
-        _survival_auc(survival_auc),
-        _calibration_ece(calibration_ece),
-        _portfolio_quality_vs_random(portfolio_quality_vs_random),
-        _portfolio_failure_rate_vs_random(portfolio_failure_rate_vs_random),
-        _claude_text_score_auc(claude_text_score_auc),
-        _progress_auc(progress_auc),
-        _abstention_rate(model_uncertainty_rate),
-        _sector_bias(top_k_sector_concentration),
-    ]
-    return results
-
-
-def all_must_pass_met(results: list[MetricResult]) -> bool:
+    values = (
+        survival_auc,
+        calibration_ece,
+        portfolio_quality_vs_random,
+        portfolio_failure_rate_vs_random,
+        claude_text_score_auc,
+        progress_auc,
+        model_uncertainty_rate,
+        top_k_sector_concentration,
+    )
+    return MetricResults(
+        spec.evaluate(value) for spec, value in zip(_METRIC_SPECS, values, strict=True)
+    )
+
+
+def all_must_pass_met(results: Iterable[MetricResult]) -> bool:
     """Return ``True`` only if every *must_pass* metric in *results* passed."""
     return all(r.passed for r in results if r.must_pass)
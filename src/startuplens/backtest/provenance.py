@@ -8,11 +8,20 @@ pass/fail verdicts.
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from datetime import date
 from typing import Any
 
 from startuplens.db import execute_query
 
+# Compact JSON text for the jsonb columns; jsonb discards the whitespace, so
+# the stored values are unchanged.  json.dumps() only reuses its cached
+# encoder for default options, hence one module-level compact encoder.
+_to_json = json.JSONEncoder(separators=(",", ":")).encode
+
+# alt_data_signals is usually omitted; skip the encoder for that case.
+_EMPTY_JSON_LIST = "[]"
+
 
 def log_backtest_run(
     conn: Any,
@@ -57,11 +66,11 @@ def log_backtest_run(
             data_snapshot_date,
             train_window,
             test_window,
-            json.dumps(features_active),
-            json.dumps(alt_data_signals or []),
-            json.dumps(metrics),
-            json.dumps(baselines),
-            json.dumps(pass_fail),
+            _to_json(features_active),
+            _to_json(alt_data_signals) if alt_data_signals else _EMPTY_JSON_LIST,
+            _to_json(metrics),
+            _to_json(baselines),
+            _to_json(pass_fail),
             all_passed,
             notes,
         ),
@@ -79,6 +88,19 @@ def get_backtest_run(conn: Any, run_id: int) -> dict | None:
     return rows[0] if rows else None
 
 
+def get_backtest_runs_bulk(conn: Any, run_ids: Sequence[int]) -> dict[int, dict]:
+    """Retrieve several backtest runs in one query, keyed by ID.
+
+    IDs with no matching row are simply absent from the result.
+    """
+    rows = execute_query(
+        conn,
+        "SELECT * FROM backtest_runs WHERE id = ANY(%s)",
+        (list(run_ids),),
+    )
+    return {row["id"]: row for row in rows}
+
+
 def get_latest_runs(
     conn: Any,
     model_family: str | None = None,
@@ -106,7 +128,11 @@ def get_passing_runs(
     conn: Any,
     model_family: str | None = None,
 ) -> list[dict]:
-    """Retrieve all runs where all must-pass metrics passed."""
+    """Retrieve all runs where all must-pass metrics passed.
+
+    Both queries keep the literal ``all_passed = true`` predicate so the
+    planner can use the ``idx_backtest_runs_passing`` partial index.
+    """
     if model_family:
         return execute_query(
             conn,
@@ -128,8 +154,9 @@ def compare_runs(conn: Any, run_id_a: int, run_id_b: int) -> dict:
 
     Returns a dict with keys for each metric showing both values and the delta.
     """
-    run_a = get_backtest_run(conn, run_id_a)
-    run_b = get_backtest_run(conn, run_id_b)
+    runs = get_backtest_runs_bulk(conn, [run_id_a, run_id_b])
+    run_a = runs.get(run_id_a)
+    run_b = runs.get(run_id_b)
 
     if not run_a or not run_b:
         missing = []
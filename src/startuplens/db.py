@@ -18,10 +18,20 @@ def get_connection(settings: Settings | None = None) -> psycopg.Connection:
     return psycopg.connect(settings.database_url, row_factory=dict_row)
 
 
-def execute_query(conn: psycopg.Connection, query: str, params: tuple = ()) -> list[dict]:
-    """Execute a query and return all rows as dicts."""
+def execute_query(
+    conn: psycopg.Connection,
+    query: str,
+    params: tuple = (),
+    *,
+    prepare: bool | None = None,
+) -> list[dict]:
+    """Execute a query and return all rows as dicts.
+
+    Pass ``prepare=True`` for hot, fixed-text queries so psycopg prepares
+    them server-side on first use instead of after its default threshold.
+    """
     with conn.cursor() as cur:
-        cur.execute(query, params)
+        cur.execute(query, params, prepare=prepare)
         if cur.description:
             return cur.fetchall()
         return []
@@ -7,6 +7,7 @@ from startuplens.entity_resolution.deterministic import (
     link_entity,
     match_by_legal_name,
     match_by_source_id,
+    match_by_source_ids,
     normalize_name,
 )
 from startuplens.entity_resolution.probabilistic import (
@@ -16,6 +17,7 @@ from startuplens.entity_resolution.probabilistic import (
     train_dedupe_model,
 )
 from startuplens.entity_resolution.resolver import (
+    resolve_entities_bulk,
     resolve_entity,
     run_entity_resolution,
     run_probabilistic_pass,
@@ -34,8 +36,10 @@ __all__ = [
     "link_entity",
     "match_by_legal_name",
     "match_by_source_id",
+    "match_by_source_ids",
     "merge_entities",
     "normalize_name",
+    "resolve_entities_bulk",
     "resolve_entity",
     "run_entity_resolution",
     "run_probabilistic_pass",
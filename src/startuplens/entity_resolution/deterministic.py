@@ -8,7 +8,10 @@ uses raw SQL via psycopg3.
 from __future__ import annotations
 
 import re
+import threading
 import uuid
+from collections.abc import Callable, Iterable
+from typing import Any
 
 import psycopg
 from unidecode import unidecode
@@ -59,8 +62,56 @@ def normalize_name(name: str) -> str:
 
 # ---------------------------------------------------------------------------
 # Lookup helpers
+#
+# These helpers run once per record with fixed SQL text, so they ask psycopg
+# to prepare the statement on first use (prepare=True) rather than
+# re-parsing and re-planning it on every call.
 # ---------------------------------------------------------------------------
 
+class _InflightLookups:
+    """Coalesce concurrent identical look-ups onto a single query.
+
+    The first caller for a key runs the query; callers that arrive with the
+    same key while it is in flight wait for and share that result.  Nothing
+    is cached once the query completes.  *event_factory* builds the marker
+    that waiting callers block on.
+    """
+
+    def __init__(self, event_factory: Callable[[], threading.Event] = threading.Event) -> None:
+        self._new_event = event_factory
+        self._lock = threading.Lock()
+        self._inflight: dict[tuple, tuple[threading.Event, dict[str, Any]]] = {}
+
+    def run(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        with self._lock:
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = (self._new_event(), {})
+                self._inflight[key] = pending
+        done, outcome = pending
+
+        if not leader:
+            done.wait()
+            if "error" in outcome:
+                raise outcome["error"]
+            return outcome["result"]
+
+        try:
+            outcome["result"] = fetch()
+        except BaseException as exc:
+            outcome["error"] = exc
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            done.set()
+        return outcome["result"]
+
+
+_source_id_lookups = _InflightLookups()
+
+
 def match_by_source_id(
     conn: psycopg.Connection,
     source: str,
@@ -68,21 +119,57 @@ def match_by_source_id(
 ) -> str | None:
     """Look up an entity_id by exact (source, source_identifier) pair.
 
-    Returns the entity_id as a string, or ``None`` if no link exists.
+    Concurrent calls for the same pair on the same connection share one
+    query.  Returns the entity_id as a string, or ``None`` if no link exists.
     """
-    rows = execute_query(
-        conn,
-        """
-        SELECT entity_id::text
-        FROM entity_links
-        WHERE source = %s AND source_identifier = %s
-        LIMIT 1
-        """,
-        (source, source_identifier),
-    )
-    if rows:
-        return rows[0]["entity_id"]
-    return None
+    def fetch() -> str | None:
+        rows = execute_query(
+            conn,
+            """
+            SELECT entity_id::text
+            FROM entity_links
+            WHERE source = %s AND source_identifier = %s
+            LIMIT 1
+            """,
+            (source, source_identifier),
+            prepare=True,
+        )
+        if rows:
+            return rows[0]["entity_id"]
+        return None
+
+    return _source_id_lookups.run((id(conn), source, source_identifier), fetch)
+
+
+def match_by_source_ids(
+    conn: psycopg.Connection,
+    keys: Iterable[tuple[str, str]],
+    *,
+    batch_size: int = 500,
+) -> dict[tuple[str, str], str]:
+    """Look up entity_ids for many (source, source_identifier) pairs at once.
+
+    Issues one IN-list SELECT per *batch_size* distinct pairs instead of one
+    round-trip per pair.  Pairs without a link are absent from the result.
+    """
+    unique = list(dict.fromkeys(keys))
+    found: dict[tuple[str, str], str] = {}
+    for i in range(0, len(unique), batch_size):
+        batch = unique[i : i + batch_size]
+        placeholders = ", ".join(["(%s, %s)"] * len(batch))
+        rows = execute_query(
+            conn,
+            f"""
+            SELECT DISTINCT ON (source, source_identifier)
+                source, source_identifier, entity_id::text
+            FROM entity_links
+            WHERE (source, source_identifier) IN ({placeholders})
+            """,
+            tuple(v for key in batch for v in key),
+        )
+        for r in rows:
+            found[(r["source"], r["source_identifier"])] = r["entity_id"]
+    return found
 
 
 def match_by_legal_name(
@@ -106,6 +193,7 @@ def match_by_legal_name(
         LIMIT 1
         """,
         (norm, country.lower()),
+        prepare=True,
     )
     if rows:
         return rows[0]["entity_id"]
@@ -127,7 +215,8 @@ def create_canonical_entity(
     ``match_by_legal_name`` look-ups work without re-normalising on
     every query.
     """
-    entity_id = str(uuid.uuid4())
+    # psycopg adapts uuid.UUID natively; only format it at the return boundary.
+    entity_id = uuid.uuid4()
     norm = normalize_name(name)
     execute_query(
         conn,
@@ -136,8 +225,9 @@ def create_canonical_entity(
         VALUES (%s, %s, %s)
         """,
         (entity_id, norm, country.lower()),
+        prepare=True,
     )
-    return entity_id
+    return str(entity_id)
 
 
 def link_entity(
@@ -168,7 +258,7 @@ def link_entity(
     source_name:
         Name as it appears in the source system (optional).
     """
-    link_id = str(uuid.uuid4())
+    link_id = uuid.uuid4()
     execute_query(
         conn,
         """
@@ -178,4 +268,5 @@ def link_entity(
         VALUES (%s, %s, %s, %s, %s, %s, %s)
         """,
         (link_id, entity_id, source, source_identifier, source_name, match_method, confidence),
+        prepare=True,
     )
@@ -28,20 +28,30 @@ DEDUPE_FIELDS: list[dict[str, str]] = [
 # Training data extraction
 # ---------------------------------------------------------------------------
 
-def build_training_pairs(conn: psycopg.Connection) -> list[dict[str, str]]:
+def build_training_pairs(
+    conn: psycopg.Connection,
+    *,
+    chunk_size: int = 10_000,
+) -> list[dict[str, str]]:
     """Extract name/country pairs from canonical_entities for dedupe training.
 
     Returns a list of dicts, each with ``name`` and ``country`` keys,
     suitable for building a dedupe training set.
+
+    Rows are streamed through a server-side cursor in *chunk_size* pages,
+    so the full result set is never held client-side alongside the output.
     """
-    rows = execute_query(
-        conn,
-        "SELECT id::text AS entity_id, primary_name, country FROM canonical_entities",
-    )
-    return [
-        {"entity_id": r["entity_id"], "name": r["primary_name"], "country": r["country"]}
-        for r in rows
-    ]
+    pairs: list[dict[str, str]] = []
+    with conn.cursor(name="er_training_pairs") as cur:
+        cur.execute(
+            "SELECT id::text AS entity_id, primary_name, country FROM canonical_entities",
+        )
+        while rows := cur.fetchmany(chunk_size):
+            pairs.extend(
+                {"entity_id": r["entity_id"], "name": r["primary_name"], "country": r["country"]}
+                for r in rows
+            )
+    return pairs
 
 
 # ---------------------------------------------------------------------------
@@ -153,27 +163,25 @@ def merge_entities(
     merge_id:
         UUID of the entity to absorb and remove.
     """
-    # Tables with unique constraints on entity_id + other columns:
-    # delete merge_id rows that would conflict, then update the rest.
-    for table in ("feature_store", "backtest_holdout"):
-        execute_query(
-            conn,
-            f"DELETE FROM {table} WHERE entity_id = %s",  # noqa: S608
-            (merge_id,),
-        )
-
-    # Reassign remaining FK references from merge_id → keep_id
-    for table in (
+    # Tables with unique constraints on entity_id + other columns: delete the
+    # merge_id rows that would conflict.  Remaining FK references are
+    # reassigned merge_id → keep_id.  Everything runs as data-modifying CTEs
+    # of one statement, so it is a single round-trip under one snapshot.
+    deletes = ("feature_store", "backtest_holdout")
+    updates = (
         "entity_links", "companies", "evaluations",
         "investments", "anti_portfolio", "deal_funnel",
-    ):
-        execute_query(
-            conn,
-            f"UPDATE {table} SET entity_id = %s WHERE entity_id = %s",  # noqa: S608
-            (keep_id, merge_id),
-        )
+    )
+    ctes = [
+        f"del_{table} AS (DELETE FROM {table} WHERE entity_id = %s)"  # noqa: S608
+        for table in deletes
+    ] + [
+        f"upd_{table} AS (UPDATE {table} SET entity_id = %s WHERE entity_id = %s)"  # noqa: S608
+        for table in updates
+    ]
+    params = (merge_id,) * len(deletes) + (keep_id, merge_id) * len(updates) + (merge_id,)
     execute_query(
         conn,
-        "DELETE FROM canonical_entities WHERE id = %s",
-        (merge_id,),
+        "WITH " + ",\n     ".join(ctes) + "\nDELETE FROM canonical_entities WHERE id = %s",
+        params,
     )
@@ -6,15 +6,18 @@ records to canonical entities.
 
 from __future__ import annotations
 
+import uuid
 from pathlib import Path
 
 import psycopg
 
+from startuplens.db import execute_query
 from startuplens.entity_resolution.deterministic import (
     create_canonical_entity,
     link_entity,
     match_by_legal_name,
     match_by_source_id,
+    normalize_name,
 )
 from startuplens.entity_resolution.probabilistic import (
     build_training_pairs,
@@ -80,6 +83,134 @@ def resolve_entity(
 # Batch deterministic resolution
 # ---------------------------------------------------------------------------
 
+def resolve_entities_bulk(
+    conn: psycopg.Connection,
+    records: list[dict],
+    *,
+    batch_size: int = 500,
+) -> tuple[list[str], int]:
+    """Resolve a batch of records with a fixed number of queries per batch.
+
+    Applies the same resolution order as :func:`resolve_entity`, but
+    instead of two look-ups per record each batch issues at most four
+    statements:
+
+      1. One ``entity_links`` SELECT for every (source, source_identifier).
+      2. One ``canonical_entities`` SELECT by normalised name + country
+         for the records that missed step 1.
+      3. One multi-row INSERT for new canonical entities.
+      4. One multi-row INSERT for the new entity links.
+
+    Records are processed in order, so a duplicate source key or a repeated
+    name + country later in the batch resolves to the entity created for
+    the first occurrence, exactly as sequential ``resolve_entity`` calls
+    would.
+
+    Returns
+    -------
+    tuple
+        ``(entity_ids, created)`` — the resolved ``entity_id`` for each
+        record in input order, and the number of canonical entities created.
+    """
+    entity_ids: list[str] = []
+    created = 0
+
+    for i in range(0, len(records), batch_size):
+        batch = records[i : i + batch_size]
+        keys = list(dict.fromkeys((r["source"], r["source_identifier"]) for r in batch))
+
+        # 1. Source-ID matches
+        placeholders = ", ".join(["(%s, %s)"] * len(keys))
+        rows = execute_query(
+            conn,
+            f"""
+            SELECT source, source_identifier, entity_id::text
+            FROM entity_links
+            WHERE (source, source_identifier) IN ({placeholders})
+            """,
+            tuple(v for key in keys for v in key),
+        )
+        by_source: dict[tuple[str, str], str] = {
+            (r["source"], r["source_identifier"]): r["entity_id"] for r in rows
+        }
+
+        # 2. Name + country matches for the misses
+        names = {
+            key: (normalize_name(r["name"]), r["country"].lower())
+            for r in batch
+            if (key := (r["source"], r["source_identifier"])) not in by_source
+        }
+        by_name: dict[tuple[str, str], str] = {}
+        if names:
+            name_keys = list(dict.fromkeys(names.values()))
+            placeholders = ", ".join(["(%s, %s)"] * len(name_keys))
+            rows = execute_query(
+                conn,
+                f"""
+                SELECT DISTINCT ON (lower(primary_name), lower(country))
+                    id::text AS entity_id,
+                    lower(primary_name) AS primary_name,
+                    lower(country) AS country
+                FROM canonical_entities
+                WHERE (lower(primary_name), lower(country)) IN ({placeholders})
+                """,
+                tuple(v for key in name_keys for v in key),
+            )
+            by_name = {(r["primary_name"], r["country"]): r["entity_id"] for r in rows}
+
+        # 3. Walk the batch in order, creating entities for remaining misses
+        ce_params: list = []
+        el_params: list = []
+        for r in batch:
+            key = (r["source"], r["source_identifier"])
+            entity_id = by_source.get(key)
+            if entity_id is None:
+                name_key = names[key]
+                entity_id = by_name.get(name_key)
+                if entity_id is not None:
+                    confidence, match_method = 90, "deterministic"
+                else:
+                    new_id = uuid.uuid4()
+                    entity_id = str(new_id)
+                    by_name[name_key] = entity_id
+                    ce_params.extend([new_id, *name_key])
+                    created += 1
+                    confidence, match_method = 100, "exact_id"
+                by_source[key] = entity_id
+                el_params.extend([
+                    uuid.uuid4(), entity_id, r["source"], r["source_identifier"],
+                    r["name"], match_method, confidence,
+                ])
+            entity_ids.append(entity_id)
+
+        if ce_params:
+            placeholders = ", ".join(["(%s, %s, %s)"] * (len(ce_params) // 3))
+            execute_query(
+                conn,
+                f"""
+                INSERT INTO canonical_entities (id, primary_name, country)
+                VALUES {placeholders}
+                """,
+                tuple(ce_params),
+            )
+
+        # 4. Links for everything that missed the source-ID look-up
+        if el_params:
+            placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * (len(el_params) // 7))
+            execute_query(
+                conn,
+                f"""
+                INSERT INTO entity_links
+                    (id, entity_id, source, source_identifier, source_name,
+                     match_method, confidence)
+                VALUES {placeholders}
+                """,
+                tuple(el_params),
+            )
+
+    return entity_ids, created
+
+
 def run_entity_resolution(
     conn: psycopg.Connection,
     records: list[dict],
@@ -92,34 +223,18 @@ def run_entity_resolution(
       - ``source``
       - ``source_identifier``
 
+    Resolution is delegated to :func:`resolve_entities_bulk`.
+
     Returns
     -------
     dict
         ``{"matched": int, "created": int, "total": int}``
     """
-    matched = 0
-    created = 0
+    if not records:
+        return {"matched": 0, "created": 0, "total": 0}
 
-    for rec in records:
-        # Check if a link already exists (source-ID match) or a name match exists
-        existing = match_by_source_id(conn, rec["source"], rec["source_identifier"])
-        if existing is None:
-            existing = match_by_legal_name(conn, rec["name"], rec["country"])
-
-        if existing is not None:
-            matched += 1
-        else:
-            created += 1
-
-        resolve_entity(
-            conn,
-            name=rec["name"],
-            country=rec["country"],
-            source=rec["source"],
-            source_identifier=rec["source_identifier"],
-        )
-
-    return {"matched": matched, "created": created, "total": len(records)}
+    _, created = resolve_entities_bulk(conn, records)
+    return {"matched": len(records) - created, "created": created, "total": len(records)}
 
 
 # ---------------------------------------------------------------------------
@@ -154,10 +269,6 @@ def bulk_create_entities(
     dict
         ``{"created": int, "skipped": int, "total": int}``
     """
-    import uuid
-
-    from startuplens.entity_resolution.deterministic import normalize_name
-
     created = 0
     skipped = 0
 
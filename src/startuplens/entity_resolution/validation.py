@@ -6,9 +6,42 @@ standard information-retrieval metrics.
 
 from __future__ import annotations
 
+import bisect
+
+import numpy as np
 import psycopg
 
-from startuplens.entity_resolution.deterministic import match_by_source_id
+from startuplens.entity_resolution.deterministic import match_by_source_ids
+
+# F1 lower bounds (inclusive) for each assessment band, ascending.  The
+# assessment for a score is _F1_ASSESSMENTS[bisect_right(_F1_THRESHOLDS, f1)].
+_F1_THRESHOLDS = (0.70, 0.85, 0.95)
+_F1_ASSESSMENTS = (
+    "POOR — significant entity resolution errors",
+    "FAIR — consider improving probabilistic matching",
+    "GOOD — acceptable for production with monitoring",
+    "EXCELLENT — production-ready",
+)
+
+
+def _count_metrics(
+    ids_a: np.ndarray,
+    ids_b: np.ndarray,
+    same: np.ndarray,
+) -> tuple[int, int, int]:
+    """Count true positives, false positives and false negatives.
+
+    *ids_a* / *ids_b* hold the resolved entity index for each side of a
+    pair (``-1`` when the record is unresolved); *same* is the ground-truth
+    flag.  An unresolved pair can never be a positive prediction, so it only
+    counts as a false negative when the pair is expected to match.
+    True negatives are not tracked (not useful for P/R/F1).
+    """
+    predicted_same = (ids_a >= 0) & (ids_b >= 0) & (ids_a == ids_b)
+    true_positives = int(np.count_nonzero(predicted_same & same))
+    false_positives = int(np.count_nonzero(predicted_same & ~same))
+    false_negatives = int(np.count_nonzero(~predicted_same & same))
+    return true_positives, false_positives, false_negatives
 
 
 def compute_entity_resolution_metrics(
@@ -38,33 +71,31 @@ def compute_entity_resolution_metrics(
           "true_positives": int, "false_positives": int,
           "false_negatives": int, "total_pairs": int}``
     """
-    true_positives = 0
-    false_positives = 0
-    false_negatives = 0
-
-    for pair in ground_truth:
-        src_a = pair["source_a"]
-        src_b = pair["source_b"]
-        expected_same = pair["same_entity"]
-
-        id_a = match_by_source_id(conn, src_a["source"], src_a["source_identifier"])
-        id_b = match_by_source_id(conn, src_b["source"], src_b["source_identifier"])
-
-        # If either record is unresolved, we can't make a determination
-        if id_a is None or id_b is None:
-            if expected_same:
-                false_negatives += 1
-            continue
-
-        predicted_same = id_a == id_b
-
-        if predicted_same and expected_same:
-            true_positives += 1
-        elif predicted_same and not expected_same:
-            false_positives += 1
-        elif not predicted_same and expected_same:
-            false_negatives += 1
-        # True negatives are not tracked (not useful for P/R/F1).
+    n = len(ground_truth)
+    ids_a = np.full(n, -1, dtype=np.int32)
+    ids_b = np.full(n, -1, dtype=np.int32)
+    same = np.zeros(n, dtype=bool)
+
+    # Resolve every distinct source record in batched look-ups, then map
+    # entity UUIDs to stable ints so the counting pass compares integers.
+    keys = [
+        (src["source"], src["source_identifier"])
+        for pair in ground_truth
+        for src in (pair["source_a"], pair["source_b"])
+    ]
+    found = match_by_source_ids(conn, keys) if keys else {}
+    entity_index: dict[str, int] = {}
+    resolved = {
+        key: entity_index.setdefault(entity_id, len(entity_index))
+        for key, entity_id in found.items()
+    }
+
+    for i, pair in enumerate(ground_truth):
+        ids_a[i] = resolved.get(keys[2 * i], -1)
+        ids_b[i] = resolved.get(keys[2 * i + 1], -1)
+        same[i] = pair["same_entity"]
+
+    true_positives, false_positives, false_negatives = _count_metrics(ids_a, ids_b, same)
 
     precision = (
         true_positives / (true_positives + false_positives)
@@ -122,13 +153,6 @@ def generate_validation_report(metrics: dict[str, float]) -> str:
 
     # Add a quality assessment
     f1 = metrics.get("f1", 0.0)
-    if f1 >= 0.95:
-        lines.append("\nAssessment: EXCELLENT — production-ready")
-    elif f1 >= 0.85:
-        lines.append("\nAssessment: GOOD — acceptable for production with monitoring")
-    elif f1 >= 0.70:
-        lines.append("\nAssessment: FAIR — consider improving probabilistic matching")
-    else:
-        lines.append("\nAssessment: POOR — significant entity resolution errors")
+    lines.append(f"\nAssessment: {_F1_ASSESSMENTS[bisect.bisect_right(_F1_THRESHOLDS, f1)]}")
 
     return "\n".join(lines)
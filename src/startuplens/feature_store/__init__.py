@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from startuplens.feature_store.registry import (
+    FEATURE_NAMES,
     FEATURE_REGISTRY,
     FeatureDefinition,
     get_all_feature_names,
@@ -20,6 +21,7 @@ from startuplens.feature_store.store import (
 )
 
 __all__ = [
+    "FEATURE_NAMES",
     "FEATURE_REGISTRY",
     "FeatureDefinition",
     "get_all_feature_names",
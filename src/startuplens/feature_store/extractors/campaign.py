@@ -17,8 +17,9 @@ def extract_campaign_features(record: dict) -> dict[str, Any]:
     Returns:
         Dict of {feature_name: value} for all campaign-family features.
     """
-    funding_target = record.get("funding_target")
-    amount_raised = record.get("amount_raised")
+    get = record.get
+    funding_target = get("funding_target")
+    amount_raised = get("amount_raised")
 
     # Compute overfunding ratio safely
     overfunding_ratio: float | None = None
@@ -32,10 +33,10 @@ def extract_campaign_features(record: dict) -> dict[str, Any]:
         "funding_target": funding_target,
         "amount_raised": amount_raised,
         "overfunding_ratio": overfunding_ratio,
-        "equity_offered_pct": record.get("equity_offered_pct"),
-        "pre_money_valuation": record.get("pre_money_valuation"),
-        "investor_count": record.get("investor_count"),
-        "funding_velocity_days": record.get("funding_velocity_days"),
-        "eis_seis_eligible": record.get("eis_seis_eligible"),
-        "platform": record.get("platform"),
+        "equity_offered_pct": get("equity_offered_pct"),
+        "pre_money_valuation": get("pre_money_valuation"),
+        "investor_count": get("investor_count"),
+        "funding_velocity_days": get("funding_velocity_days"),
+        "eis_seis_eligible": get("eis_seis_eligible"),
+        "platform": get("platform"),
     }
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> date:
+    """Parse a YYYY-MM-DD string; cached because cohort dates repeat heavily."""
+    return date.fromisoformat(value)
+
+
 def _compute_age_months(
     incorporation_date: date | str | None,
     campaign_date: date | str | None,
@@ -19,9 +26,9 @@ def _compute_age_months(
         return None
 
     if isinstance(incorporation_date, str):
-        incorporation_date = date.fromisoformat(incorporation_date)
+        incorporation_date = _parse_iso(incorporation_date)
     if isinstance(campaign_date, str):
-        campaign_date = date.fromisoformat(campaign_date)
+        campaign_date = _parse_iso(campaign_date)
 
     delta_days = (campaign_date - incorporation_date).days
     if delta_days < 0:
@@ -42,23 +49,25 @@ def extract_company_features(record: dict) -> dict[str, Any]:
     Returns:
         Dict of {feature_name: value} for all company-family features.
     """
-    revenue_at_raise = record.get("revenue_at_raise")
+    get = record.get
+    revenue_at_raise = get("revenue_at_raise")
     pre_revenue = revenue_at_raise is None or revenue_at_raise == 0
 
     company_age_months = _compute_age_months(
-        record.get("incorporation_date"),
-        record.get("campaign_date"),
+        get("incorporation_date"),
+        get("campaign_date"),
     )
 
     return {
         "company_age_months": company_age_months,
-        "employee_count": record.get("employee_count"),
+        "employee_count": get("employee_count"),
         "revenue_at_raise": revenue_at_raise,
         "pre_revenue": pre_revenue,
-        "revenue_growth_rate": record.get("revenue_growth_rate"),
-        "total_prior_funding": record.get("total_prior_funding"),
-        "prior_vc_backing": record.get("prior_vc_backing"),
-        "sector": record.get("sector"),
-        "revenue_model_type": record.get("revenue_model_type"),
-        "country": record.get("country"),
+        "revenue_growth_rate": get("revenue_growth_rate"),
+        "total_prior_funding": get("total_prior_funding"),
+        "prior_vc_backing": get("prior_vc_backing"),
+        "sector": get("sector"),
+        "revenue_model_type": get("revenue_model_type"),
+        "country": get("country"),
     }
+
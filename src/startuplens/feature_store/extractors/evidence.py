@@ -7,12 +7,13 @@ from typing import Any
 
 def extract_evidence_features(record: dict) -> dict[str, Any]:
     """Compute lightweight evidence quality metrics for confidence gating."""
+    get = record.get
     source_flags = [
-        bool(record.get("source")),
-        bool(record.get("campaign_date")),
-        bool(record.get("round_date")),
-        bool(record.get("total_assets") is not None),
-        bool(record.get("company_status")),
+        bool(get("source")),
+        bool(get("campaign_date")),
+        bool(get("round_date")),
+        bool(get("total_assets") is not None),
+        bool(get("company_status")),
     ]
     data_source_count = sum(1 for v in source_flags if v)
 
@@ -30,7 +31,7 @@ def extract_evidence_features(record: dict) -> dict[str, Any]:
         "country",
         "sector",
     ]
-    present = sum(1 for field in tracked_fields if record.get(field) is not None)
+    present = sum(1 for field in tracked_fields if get(field) is not None)
     field_completeness_ratio = present / len(tracked_fields)
 
     return {
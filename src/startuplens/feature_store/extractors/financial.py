@@ -17,8 +17,9 @@ def extract_financial_features(record: dict) -> dict[str, Any]:
     Returns:
         Dict of {feature_name: value} for all financial-family features.
     """
-    total_assets = record.get("total_assets")
-    total_debt = record.get("total_debt")
+    get = record.get
+    total_assets = get("total_assets")
+    total_debt = get("total_debt")
 
     # Compute debt-to-asset ratio safely
     debt_to_asset_ratio: float | None = None
@@ -32,7 +33,7 @@ def extract_financial_features(record: dict) -> dict[str, Any]:
         "total_assets": total_assets,
         "total_debt": total_debt,
         "debt_to_asset_ratio": debt_to_asset_ratio,
-        "cash_position": record.get("cash_position"),
-        "burn_rate_monthly": record.get("burn_rate_monthly"),
-        "gross_margin": record.get("gross_margin"),
+        "cash_position": get("cash_position"),
+        "burn_rate_monthly": get("burn_rate_monthly"),
+        "gross_margin": get("gross_margin"),
     }
@@ -14,8 +14,9 @@ def extract_market_regime_features(record: dict) -> dict[str, Any]:
     Returns:
         Dict of {feature_name: value} for all market_regime-family features.
     """
+    get = record.get
     return {
-        "interest_rate_regime": record.get("interest_rate_regime"),
-        "equity_market_regime": record.get("equity_market_regime"),
-        "ecf_quarterly_volume": record.get("ecf_quarterly_volume"),
+        "interest_rate_regime": get("interest_rate_regime"),
+        "equity_market_regime": get("equity_market_regime"),
+        "ecf_quarterly_volume": get("ecf_quarterly_volume"),
     }
@@ -21,19 +21,20 @@ def extract_regulatory_features(record: dict) -> dict[str, Any]:
     Returns:
         Dict of {feature_name: value} for all regulatory-family features.
     """
+    get = record.get
     # Company status: active, dissolved, liquidation, etc.
-    status = record.get("company_status") or record.get("current_status")
+    status = get("company_status") or get("current_status")
 
     # Accounts overdue flag
-    accounts_overdue = record.get("accounts_overdue")
+    accounts_overdue = get("accounts_overdue")
 
     # Charges count (secured debts / mortgages)
-    charges_count = record.get("charges_count")
-    if charges_count is None and record.get("has_charges"):
+    charges_count = get("charges_count")
+    if charges_count is None and get("has_charges"):
         charges_count = 1  # At least one charge if has_charges is True
 
     # Director disqualifications
-    disqualifications = record.get("director_disqualifications")
+    disqualifications = get("director_disqualifications")
 
     return {
         "company_status": status,
@@ -14,9 +14,10 @@ def extract_team_features(record: dict) -> dict[str, Any]:
     Returns:
         Dict of {feature_name: value} for all team-family features.
     """
+    get = record.get
     return {
-        "founder_count": record.get("founder_count"),
-        "domain_experience_years": record.get("domain_experience_years"),
-        "prior_exits": record.get("prior_exits"),
-        "accelerator_alumni": record.get("accelerator_alumni"),
+        "founder_count": get("founder_count"),
+        "domain_experience_years": get("domain_experience_years"),
+        "prior_exits": get("prior_exits"),
+        "accelerator_alumni": get("accelerator_alumni"),
     }
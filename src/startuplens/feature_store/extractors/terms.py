@@ -18,21 +18,22 @@ def extract_terms_features(record: dict) -> dict[str, Any]:
     Returns:
         Dict of {feature_name: value} for all terms-family features.
     """
-    instrument = record.get("instrument_type")
-    qualified = record.get("qualified_institutional")
+    get = record.get
+    instrument = get("instrument_type")
+    qualified = get("qualified_institutional")
 
     # If qualified_institutional not directly available, check crowdfunding_outcomes field
     if qualified is None:
-        qualified = record.get("qualified_institutional_coinvestor")
+        qualified = get("qualified_institutional_coinvestor")
 
     return {
         "instrument_type": instrument,
-        "valuation_cap": record.get("valuation_cap"),
-        "discount_rate": record.get("discount_rate"),
-        "mfn_clause": record.get("mfn_clause"),
-        "liquidation_pref_multiple": record.get("liquidation_pref_multiple"),
-        "liquidation_participation": record.get("liquidation_participation"),
-        "seniority_position": record.get("seniority_position"),
-        "pro_rata_rights": record.get("pro_rata_rights"),
+        "valuation_cap": get("valuation_cap"),
+        "discount_rate": get("discount_rate"),
+        "mfn_clause": get("mfn_clause"),
+        "liquidation_pref_multiple": get("liquidation_pref_multiple"),
+        "liquidation_participation": get("liquidation_participation"),
+        "seniority_position": get("seniority_position"),
+        "pro_rata_rights": get("pro_rata_rights"),
         "qualified_institutional": qualified,
     }
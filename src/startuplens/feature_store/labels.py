@@ -10,6 +10,27 @@ from __future__ import annotations
 
 from datetime import date
 
+import numpy as np
+import pandas as pd
+
+# Companies House statuses that are a hard (failed) outcome, with the
+# outcome_detail each one maps to.
+_UK_FAILED_DETAIL: dict[str, str] = {
+    "dissolved": "dissolved",
+    "liquidation": "liquidation",
+    "administration": "administration",
+    "converted-closed": "converted_closed",
+}
+_UK_TERMINAL_STATUSES = frozenset(_UK_FAILED_DETAIL)
+
+# News-derived outcome -> (outcome, outcome_detail); takes precedence over SEC status.
+_US_NEWS_OUTCOMES: dict[str, tuple[str, str]] = {
+    "shutdown": ("failed", "news_confirmed_shutdown"),
+    "acquired": ("exited", "acquisition"),
+    "ipo": ("exited", "ipo"),
+    "operating": ("trading", "news_confirmed_operating"),
+}
+
 
 def assign_label_tier_uk(
     companies_house_status: str | None,
@@ -31,7 +52,7 @@ def assign_label_tier_uk(
     status = companies_house_status.lower()
 
     # Hard outcomes with evidence
-    if status in ("dissolved", "liquidation", "administration", "converted-closed"):
+    if status in _UK_TERMINAL_STATUSES:
         return 1
 
     if status == "active":
@@ -45,6 +66,34 @@ def assign_label_tier_uk(
     return 3
 
 
+def assign_label_tiers_uk_batch(
+    companies_house_status: pd.Series,
+    last_accounts_date: pd.Series,
+    accounts_overdue: pd.Series,
+) -> pd.Series:
+    """Vectorised :func:`assign_label_tier_uk` over aligned Series.
+
+    Applies the same rules as the scalar function to a whole cohort at once.
+    Missing statuses give Tier 3 and missing ``accounts_overdue`` values are
+    treated as ``False``.
+
+    Returns:
+        Integer tier Series sharing the index of *companies_house_status*.
+    """
+    status = companies_house_status.str.lower()
+    active = status.eq("active").to_numpy(dtype=bool)
+    terminal = status.isin(_UK_TERMINAL_STATUSES).to_numpy(dtype=bool)
+    filed = last_accounts_date.notna().to_numpy(dtype=bool)
+    overdue = accounts_overdue.fillna(False).to_numpy(dtype=bool)
+
+    tiers = np.select(
+        [terminal | (active & filed & ~overdue), active],
+        [1, 2],
+        default=3,
+    )
+    return pd.Series(tiers, index=companies_house_status.index, name="label_tier")
+
+
 def assign_label_tier_us(
     sec_filing_status: str | None = None,
     news_verified: bool = False,
@@ -91,14 +140,9 @@ def classify_uk_outcome(
     """
     status = companies_house_status.lower()
 
-    if status in ("dissolved",):
-        return ("failed", "dissolved")
-    if status in ("liquidation",):
-        return ("failed", "liquidation")
-    if status in ("administration",):
-        return ("failed", "administration")
-    if status == "converted-closed":
-        return ("failed", "converted_closed")
+    detail = _UK_FAILED_DETAIL.get(status)
+    if detail is not None:
+        return ("failed", detail)
     if status == "active":
         if accounts_overdue:
             return ("trading", "active_distress_signals")
@@ -115,14 +159,9 @@ def classify_us_outcome(
 
     news_outcome can be: operating, shutdown, acquired, ipo, None
     """
-    if news_outcome == "shutdown":
-        return ("failed", "news_confirmed_shutdown")
-    if news_outcome == "acquired":
-        return ("exited", "acquisition")
-    if news_outcome == "ipo":
-        return ("exited", "ipo")
-    if news_outcome == "operating":
-        return ("trading", "news_confirmed_operating")
+    news = _US_NEWS_OUTCOMES.get(news_outcome)
+    if news is not None:
+        return news
 
     if sec_filing_status:
         return ("trading", f"sec_status_{sec_filing_status}")
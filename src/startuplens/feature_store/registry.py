@@ -111,6 +111,7 @@ FEATURE_REGISTRY: list[FeatureDefinition] = [
 # Lookup helpers
 
 _BY_NAME: dict[str, FeatureDefinition] = {f.name: f for f in FEATURE_REGISTRY}
+FEATURE_NAMES: frozenset[str] = frozenset(_BY_NAME)
 _BY_FAMILY: dict[str, list[FeatureDefinition]] = {}
 for _f in FEATURE_REGISTRY:
     _BY_FAMILY.setdefault(_f.family, []).append(_f)
@@ -140,7 +141,7 @@ def get_training_feature_names() -> list[str]:
 
 def is_valid_feature(name: str) -> bool:
     """Check if a feature name is registered."""
-    return name in _BY_NAME
+    return name in FEATURE_NAMES
 
 
 def generate_materialized_view_sql() -> str:
@@ -7,13 +7,84 @@ point-in-time correct queries to prevent data leakage in training.
 from __future__ import annotations
 
 import json
+import math
+from collections.abc import Callable, Iterator
 from datetime import date
 from decimal import Decimal
 from typing import Any
 
 import psycopg
+from psycopg.rows import tuple_row
 
-from startuplens.feature_store.registry import get_feature, is_valid_feature
+from startuplens.feature_store.registry import (
+    FEATURE_NAMES,
+    FeatureDefinition,
+    get_feature,
+)
+
+# Rows per fetchmany() page on the read paths.
+_FETCH_SIZE = 1024
+
+
+def _is_numeric(value: Any) -> bool:
+    # bool is a subclass of int, but True/False are not numeric features.
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_bool_strict(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+# Value checker for each registry dtype.
+_DTYPE_CHECKERS: dict[str, Callable[[Any], bool]] = {
+    "numeric": _is_numeric,
+    "boolean": _is_bool_strict,
+    "categorical": _is_str,
+}
+
+
+def _spec_for(feature_name: str) -> FeatureDefinition:
+    """Resolve a feature definition with a single registry lookup.
+
+    Raises:
+        ValueError: If feature_name is not in the registry.
+    """
+    try:
+        return get_feature(feature_name)
+    except KeyError:
+        msg = f"Unknown feature: {feature_name!r}"
+        raise ValueError(msg) from None
+
+
+# Pre-encoded JSONB payloads for the constant scalar values.
+_JSONB_CONSTANTS: dict[object, str] = {
+    True: '{"value": true}',
+    False: '{"value": false}',
+    None: '{"value": null}',
+}
+
+
+def _encode_jsonb(value: Any) -> str:
+    """Encode a feature value as the ``{"value": X}`` JSONB payload.
+
+    Scalars (the common case) are formatted directly; anything else goes
+    through ``json.dumps``.  Output is identical to
+    ``json.dumps({"value": value})``.
+    """
+    kind = type(value)
+    if kind is bool or value is None:
+        return _JSONB_CONSTANTS[value]
+    if kind is int:
+        return f'{{"value": {value}}}'
+    if kind is float and math.isfinite(value):
+        return f'{{"value": {value!r}}}'
+    if isinstance(value, Decimal):
+        value = float(value)
+    return json.dumps({"value": value})
 
 
 def validate_feature_write(feature_name: str, value: Any) -> bool:
@@ -21,23 +92,17 @@ def validate_feature_write(feature_name: str, value: Any) -> bool:
 
     Returns True if the write is valid, False otherwise.
     """
-    if not is_valid_feature(feature_name):
+    try:
+        feat = _spec_for(feature_name)
+    except ValueError:
         return False
 
-    feat = get_feature(feature_name)
-
     # None values are always allowed (missing data)
     if value is None:
         return True
 
-    if feat.dtype == "numeric":
-        return isinstance(value, (int, float))
-    if feat.dtype == "boolean":
-        return isinstance(value, bool)
-    if feat.dtype == "categorical":
-        return isinstance(value, str)
-
-    return False
+    checker = _DTYPE_CHECKERS.get(feat.dtype)
+    return checker is not None and checker(value)
 
 
 def write_feature(
@@ -57,13 +122,8 @@ def write_feature(
     Raises:
         ValueError: If feature_name is not in the registry.
     """
-    if not is_valid_feature(feature_name):
-        msg = f"Unknown feature: {feature_name!r}"
-        raise ValueError(msg)
-
-    feat = get_feature(feature_name)
-    v = float(value) if isinstance(value, Decimal) else value
-    feature_value = json.dumps({"value": v})
+    feat = _spec_for(feature_name)
+    feature_value = _encode_jsonb(value)
 
     sql = """
         INSERT INTO feature_store
@@ -92,19 +152,37 @@ def write_features_batch(
     as_of_date: date,
     source: str,
     label_tier: int = 3,
+    *,
+    validate_values: bool = False,
 ) -> int:
     """Batch-write multiple features for the same entity and date.
 
+    Feature names are checked against the registry once, up front.  Pass
+    ``validate_values=True`` to also dtype-check every value with
+    :func:`validate_feature_write`; it is off by default because the
+    extraction path feeds raw database values (e.g. ``Decimal`` for numeric
+    columns) that the strict check would reject.
+
     Returns the number of features written. Skips features with None values.
 
     Raises:
-        ValueError: If any feature name is not in the registry.
+        ValueError: If any feature name is not in the registry, or if
+            ``validate_values`` is set and a value has the wrong dtype.
     """
-    unknown = [name for name in features if not is_valid_feature(name)]
+    unknown = features.keys() - FEATURE_NAMES
     if unknown:
-        msg = f"Unknown features: {unknown}"
+        msg = f"Unknown features: {sorted(unknown)}"
         raise ValueError(msg)
 
+    if validate_values:
+        invalid = [
+            name for name, value in features.items()
+            if not validate_feature_write(name, value)
+        ]
+        if invalid:
+            msg = f"Invalid feature values: {invalid}"
+            raise ValueError(msg)
+
     sql = """
         INSERT INTO feature_store
             (entity_id, as_of_date, feature_family, feature_name, feature_value,
@@ -123,8 +201,7 @@ def write_features_batch(
         if value is None:
             continue
         feat = get_feature(name)
-        v = float(value) if isinstance(value, Decimal) else value
-        feature_value = json.dumps({"value": v})
+        feature_value = _encode_jsonb(value)
         params_list.append(
             (entity_id, as_of_date, feat.family, name, feature_value, source, label_tier)
         )
@@ -138,6 +215,12 @@ def write_features_batch(
     return len(params_list)
 
 
+def _iter_rows(cur: psycopg.Cursor, size: int = _FETCH_SIZE) -> Iterator[Any]:
+    """Yield result rows in *size*-row pages rather than one ``fetchall``."""
+    while rows := cur.fetchmany(size):
+        yield from rows
+
+
 def read_features_as_of(
     conn: psycopg.Connection,
     entity_id: str,
@@ -162,14 +245,13 @@ def read_features_as_of(
     """
 
     result: dict[str, Any] = {}
-    with conn.cursor() as cur:
+    with conn.cursor(row_factory=tuple_row) as cur:
         cur.execute(sql, (entity_id, as_of_date))
         if cur.description:
-            for row in cur.fetchall():
-                feature_value = row["feature_value"]
+            for feature_name, feature_value in _iter_rows(cur):
                 if isinstance(feature_value, str):
                     feature_value = json.loads(feature_value)
-                result[row["feature_name"]] = feature_value.get("value")
+                result[feature_name] = feature_value.get("value")
 
     return result
 
@@ -192,7 +274,8 @@ def read_training_matrix(
     Returns:
         List of dicts, each with entity_id + all feature columns.
     """
-    # First, get the most recent feature values per entity/feature as of the date
+    # Take the most recent value per entity/feature as of the date, then pivot
+    # server-side so each entity arrives as a single already-wide row.
     sql = """
         WITH ranked AS (
             SELECT
@@ -208,23 +291,22 @@ def read_training_matrix(
             WHERE as_of_date <= %s
               AND label_quality_tier <= %s
         )
-        SELECT entity_id, feature_name, feature_value
+        SELECT
+            entity_id,
+            jsonb_object_agg(feature_name, feature_value->'value') AS features
         FROM ranked
         WHERE rn = 1
-        ORDER BY entity_id, feature_name
+        GROUP BY entity_id
+        ORDER BY entity_id
     """
 
-    rows_by_entity: dict[str, dict[str, Any]] = {}
-    with conn.cursor() as cur:
+    result: list[dict] = []
+    with conn.cursor(row_factory=tuple_row) as cur:
         cur.execute(sql, (as_of_date, min_label_tier))
         if cur.description:
-            for row in cur.fetchall():
-                eid = str(row["entity_id"])
-                if eid not in rows_by_entity:
-                    rows_by_entity[eid] = {"entity_id": eid}
-                feature_value = row["feature_value"]
-                if isinstance(feature_value, str):
-                    feature_value = json.loads(feature_value)
-                rows_by_entity[eid][row["feature_name"]] = feature_value.get("value")
+            for entity_id, features in _iter_rows(cur):
+                if isinstance(features, str):
+                    features = json.loads(features)
+                result.append({"entity_id": str(entity_id), **features})
 
-    return list(rows_by_entity.values())
+    return result
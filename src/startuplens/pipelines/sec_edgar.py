@@ -9,7 +9,12 @@ Rate limit: SEC requests 10 req/s max and a descriptive User-Agent header.
 
 from __future__ import annotations
 
+import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -30,6 +35,12 @@ _EDGAR_FULL_INDEX_URL = (
 # Rate-limit: 10 requests per second max
 _MIN_REQUEST_INTERVAL = 0.1  # seconds between requests
 
+# Bytes per read when streaming an index file to disk
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Index downloads in flight at once; _rate_limiter still paces the requests
+_DOWNLOAD_WORKERS = 4
+
 # Form C filing type identifiers in SEC index
 _FORM_C_TYPES = frozenset({"C", "C-U", "C/A", "C-U/A", "C-AR", "C-AR/A", "C-TR"})
 
@@ -53,23 +64,35 @@ _FIELD_MAP: dict[str, str] = {
 
 
 class _RateLimiter:
-    """Simple token-bucket rate limiter for SEC EDGAR requests."""
+    """Thread-safe sliding-window rate limiter for SEC EDGAR requests.
+
+    Allows at most *burst* requests in any window of ``burst * min_interval``
+    seconds; ``burst=1`` spaces every request *min_interval* apart.  Slots
+    are reserved under a lock and slept on outside it, so concurrent callers
+    queue up behind each other without holding the lock while waiting.
+    """
 
-    def __init__(self, min_interval: float = _MIN_REQUEST_INTERVAL) -> None:
-        self._min_interval = min_interval
-        self._last_request_time: float = 0.0
+    def __init__(self, min_interval: float = _MIN_REQUEST_INTERVAL, burst: int = 1) -> None:
+        self._window = min_interval * burst
+        # Start times of the most recent `burst` requests (possibly in the future).
+        self._starts: deque[float] = deque(maxlen=burst)
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
         """Block until the next request is allowed."""
-        now = time.monotonic()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_interval:
-            time.sleep(self._min_interval - elapsed)
-        self._last_request_time = time.monotonic()
+        with self._lock:
+            now = time.monotonic()
+            start = now
+            if len(self._starts) == self._starts.maxlen:
+                start = max(now, self._starts[0] + self._window)
+            self._starts.append(start)
+        if start > now:
+            time.sleep(start - now)
 
 
-# Module-level rate limiter shared across all calls in a pipeline run
-_rate_limiter = _RateLimiter()
+# Module-level rate limiter shared across all calls in a pipeline run:
+# up to 10 requests in any one-second window.
+_rate_limiter = _RateLimiter(burst=10)
 
 
 def _build_client(settings: Settings) -> httpx.Client:
@@ -129,20 +152,28 @@ def download_form_c_index(
     logger.info("downloading_sec_edgar_index", url=url)
     _rate_limiter.wait()
 
+    # Stream the bytes straight to disk (no decode/re-encode of a ~50MB body).
+    # Write to a temp name first: a file at dest is treated as complete above.
+    partial = dest.with_suffix(".idx.part")
     client = _build_client(settings)
     try:
-        resp = client.get(url)
-        resp.raise_for_status()
-        dest.write_text(resp.text, encoding="utf-8")
-        logger.info("saved_index", path=str(dest), bytes=len(resp.text))
+        with client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            with open(partial, "wb") as f:
+                for chunk in resp.iter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                size = f.tell()
+        partial.replace(dest)
+        logger.info("saved_index", path=str(dest), bytes=size)
     finally:
         client.close()
+        partial.unlink(missing_ok=True)
 
     return dest
 
 
-def parse_form_c_filings(index_path: Path) -> list[dict]:
-    """Parse a quarterly EDGAR index file and extract Form C filings.
+def parse_form_c_filings_iter(index_path: Path) -> Iterator[dict]:
+    """Yield the Form C filings of a quarterly EDGAR index file one at a time.
 
     The index file is a fixed-width text file with a header section followed
     by data rows. Each row contains: Company Name, Form Type, CIK, Date Filed,
@@ -151,10 +182,9 @@ def parse_form_c_filings(index_path: Path) -> list[dict]:
     Args:
         index_path: Path to the downloaded .idx file.
 
-    Returns:
-        List of dicts with keys matching _INDEX_COLUMNS, filtered to Form C types.
+    Yields:
+        Dicts with keys matching _INDEX_COLUMNS, filtered to Form C types.
     """
-    filings: list[dict] = []
     content = index_path.read_text(encoding="utf-8", errors="replace")
     lines = content.splitlines()
 
@@ -166,48 +196,91 @@ def parse_form_c_filings(index_path: Path) -> list[dict]:
             break
 
     for line in lines[data_start:]:
-        if not line.strip():
+        # SEC index uses fixed-width columns:
+        #   Company Name | Form Type | CIK | Date Filed | Filename
+        # The company name can contain spaces, so split from the right; the
+        # form type is the token immediately before the CIK.
+        parts = line.rsplit(maxsplit=4)
+        if len(parts) < 5:
             continue
 
-        # SEC index uses fixed-width columns; parse by splitting on multiple spaces
-        # Format: Company Name | Form Type | CIK | Date Filed | Filename
-        # The company name can contain spaces, so we parse from the right
-        parts = line.rsplit(maxsplit=3)
-        if len(parts) < 4:
+        # Filter to Form C types before building anything (most rows are not)
+        form_type = parts[1]
+        if form_type not in _FORM_C_TYPES:
             continue
 
-        # Extract filename, date, CIK from the rightmost columns
-        filename = parts[-1]
-        date_filed = parts[-2]
-        cik = parts[-3]
-
-        # Everything before the CIK needs further splitting
-        # Use find() (first occurrence) not rfind() because the CIK may appear in filename
-        remaining = line[: line.find(cik)].rstrip()
-        # Split remaining to separate company name from form type
-        remaining_parts = remaining.rsplit(maxsplit=1)
-        if len(remaining_parts) < 2:
-            continue
+        yield {
+            "company_name": parts[0].strip(),
+            "form_type": form_type,
+            "cik": parts[2],
+            "date_filed": parts[3],
+            "filename": parts[4],
+        }
 
-        company_name = remaining_parts[0].strip()
-        form_type = remaining_parts[1].strip()
 
-        # Filter to Form C types only
-        if form_type not in _FORM_C_TYPES:
-            continue
+def parse_form_c_filings(index_path: Path) -> list[dict]:
+    """Parse a quarterly EDGAR index file and extract Form C filings.
 
-        filings.append({
-            "company_name": company_name,
-            "form_type": form_type,
-            "cik": cik.strip(),
-            "date_filed": date_filed.strip(),
-            "filename": filename.strip(),
-        })
+    Args:
+        index_path: Path to the downloaded .idx file.
 
+    Returns:
+        List of dicts with keys matching _INDEX_COLUMNS, filtered to Form C types.
+    """
+    filings = list(parse_form_c_filings_iter(index_path))
     logger.info("parsed_form_c_filings", count=len(filings), file=index_path.name)
     return filings
 
 
+# Placeholders SEC filers use for "no amount"; float() would reject them
+# anyway, but checking first skips raising and catching a ValueError.
+_NON_NUMERIC_TOKENS = frozenset({"N/A", "n/a", "NA", "None", "none", "-", "--"})
+
+
+def _parse_money(value: str) -> float | None:
+    """Parse an amount like ``"$1,500,000"``; ``None`` if it isn't a number."""
+    # Remove currency symbols and commas (chained replace beats re.sub here)
+    cleaned = value.replace("$", "").replace(",", "").strip()
+    if not cleaned or cleaned in _NON_NUMERIC_TOKENS:
+        return None
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def _coerce_money(value: Any) -> Any:
+    return _parse_money(value) if isinstance(value, str) else value
+
+
+def _coerce_cik(value: Any) -> str:
+    # Clean CIK to just digits
+    cik = str(value).strip()
+    return cik.lstrip("0") or "0"
+
+
+def _coerce_sector(value: Any) -> str | None:
+    sector = str(value).strip().lower()
+    return sector if sector else None
+
+
+# Per-field coercion, keyed by internal field name
+_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "funding_target": _coerce_money,
+    "amount_raised": _coerce_money,
+    "amount_remaining": _coerce_money,
+    "source_id": _coerce_cik,
+    "sector": _coerce_sector,
+}
+
+# _FIELD_MAP flattened to (raw_key, internal_key, coercer) so normalizing a
+# record is one pass with a single lookup per field
+_FIELD_PLAN: tuple[tuple[str, str, Callable[[Any], Any] | None], ...] = tuple(
+    (raw_key, internal_key, _COERCERS.get(internal_key))
+    for raw_key, internal_key in _FIELD_MAP.items()
+)
+
+
 def normalize_form_c_record(raw: dict[str, Any]) -> dict[str, Any]:
     """Normalize a raw Form C record into our internal schema.
 
@@ -219,39 +292,14 @@ def normalize_form_c_record(raw: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Normalized dict ready for database insertion.
     """
-    normalized: dict[str, Any] = {}
-
-    # Map known fields
-    for raw_key, internal_key in _FIELD_MAP.items():
-        if raw_key in raw and raw[raw_key] is not None:
-            normalized[internal_key] = raw[raw_key]
-
-    # Ensure required fields have defaults
-    normalized.setdefault("name", "Unknown")
-    normalized.setdefault("source", "sec_edgar")
-    normalized.setdefault("country", "US")
-
-    # Type coercion for numeric fields
-    for numeric_field in ("funding_target", "amount_raised", "amount_remaining"):
-        if numeric_field in normalized:
-            val = normalized[numeric_field]
-            if isinstance(val, str):
-                # Remove currency symbols and commas
-                cleaned = val.replace("$", "").replace(",", "").strip()
-                try:
-                    normalized[numeric_field] = float(cleaned) if cleaned else None
-                except ValueError:
-                    normalized[numeric_field] = None
-
-    # Clean CIK to just digits
-    if "source_id" in normalized:
-        cik = str(normalized["source_id"]).strip()
-        normalized["source_id"] = cik.lstrip("0") or "0"
+    # Defaults for required fields; mapped values below override them
+    normalized: dict[str, Any] = {"name": "Unknown", "source": "sec_edgar", "country": "US"}
 
-    # Normalize sector
-    if "sector" in normalized:
-        sector = str(normalized["sector"]).strip().lower()
-        normalized["sector"] = sector if sector else None
+    get = raw.get
+    for raw_key, internal_key, coerce in _FIELD_PLAN:
+        value = get(raw_key)
+        if value is not None:
+            normalized[internal_key] = coerce(value) if coerce else value
 
     # Derive form_type metadata
     if "form_type" in raw:
@@ -260,87 +308,138 @@ def normalize_form_c_record(raw: dict[str, Any]) -> dict[str, Any]:
     return normalized
 
 
-def _is_quarter_ingested(conn: psycopg.Connection, year: int, quarter: int) -> bool:
-    """Check if a given quarter has already been ingested."""
+def _ingested_quarters(conn: psycopg.Connection) -> set[tuple[int, int]]:
+    """Return every (year, quarter) with at least one ingested Form C record.
+
+    One pass over the sec_edgar companies replaces a per-quarter
+    ``source_id LIKE '%_q{year}Q{quarter}'`` probe, which cannot use an index.
+    """
     from startuplens.db import execute_query
 
     rows = execute_query(
         conn,
-        "SELECT 1 FROM companies WHERE source = 'sec_edgar' AND source_id LIKE %s LIMIT 1",
-        (f"%_q{year}Q{quarter}",),
+        """
+        SELECT DISTINCT substring(source_id FROM '_q([0-9]{4}Q[1-4])$') AS tag
+        FROM companies
+        WHERE source = 'sec_edgar'
+        """,
     )
-    return len(rows) > 0
+    return {
+        (int(row["tag"][:4]), int(row["tag"][5]))
+        for row in rows
+        if row["tag"] is not None
+    }
 
 
-def ingest_form_c_batch(conn: psycopg.Connection, records: list[dict]) -> int:
+# Default records per page: bounds how much of a streamed input is held in
+# memory at once.
+_INGEST_PAGE_SIZE = 10_000
+
+# The company columns travel as one array per column and are unnested
+# server-side, so the statement text is the same for every page and can be
+# prepared once per connection instead of re-parsed and re-planned per page.
+_COMPANIES_UPSERT = """
+    INSERT INTO companies (name, country, sector, source, source_id, sic_code)
+    SELECT * FROM unnest(
+        %s::text[], %s::text[], %s::text[], %s::text[], %s::text[], %s::text[]
+    )
+    ON CONFLICT (source, source_id) WHERE source_id IS NOT NULL
+    DO UPDATE SET
+        name = EXCLUDED.name,
+        sector = EXCLUDED.sector
+    RETURNING id, source_id
+"""
+
+_FUNDING_ROUNDS_COPY = """
+    COPY funding_rounds (
+        company_id, round_date, round_type, instrument_type,
+        amount_raised, pre_money_valuation, platform, source
+    ) FROM STDIN
+"""
+
+
+def ingest_form_c_batch(
+    conn: psycopg.Connection,
+    records: Iterable[dict],
+    *,
+    batch_size: int = _INGEST_PAGE_SIZE,
+) -> int:
     """Insert normalized Form C records into companies + funding_rounds tables.
 
+    Records are consumed lazily, in pages of *batch_size*, so a generator
+    input is never materialised beyond one page.  Companies need upsert
+    semantics and their new ids back, so each page is one prepared
+    ``INSERT ... SELECT unnest(...) ON CONFLICT ... RETURNING``; funding
+    rounds are plain appends and are streamed with COPY.  Everything is
+    committed once, at the end.
+
     Args:
         conn: Database connection.
-        records: List of normalized dicts from normalize_form_c_record().
+        records: Normalized dicts from normalize_form_c_record() (any iterable).
+        batch_size: Records per page; must be positive.
 
     Returns:
         Number of records inserted.
     """
-    if not records:
+    if batch_size <= 0:
+        msg = f"batch_size must be positive, got {batch_size}"
+        raise ValueError(msg)
+
+    records = iter(records)
+    page = list(islice(records, batch_size))
+    if not page:
         return 0
 
     inserted = 0
 
-    for rec in records:
-        # Insert into companies table (upsert on source + source_id)
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO companies (name, country, sector, source, source_id, sic_code)
-                VALUES (%(name)s, %(country)s, %(sector)s, %(source)s, %(source_id)s, %(sic_code)s)
-                ON CONFLICT (source, source_id) WHERE source_id IS NOT NULL
-                DO UPDATE SET
-                    name = EXCLUDED.name,
-                    sector = EXCLUDED.sector
-                RETURNING id
-                """,
-                {
-                    "name": rec.get("name"),
-                    "country": rec.get("country", "US"),
-                    "sector": rec.get("sector"),
-                    "source": "sec_edgar",
-                    "source_id": rec.get("source_id", ""),
-                    "sic_code": rec.get("sic_code"),
-                },
-            )
-            row = cur.fetchone()
-            company_id = row["id"] if row else None
-
-            if company_id is None:
-                continue
-
-            # Insert funding round if we have financial data
-            if rec.get("funding_target") or rec.get("amount_raised"):
-                cur.execute(
-                    """
-                    INSERT INTO funding_rounds (
-                        company_id, round_date, round_type, instrument_type,
-                        amount_raised, pre_money_valuation, platform, source
-                    ) VALUES (
-                        %(company_id)s, %(round_date)s, %(round_type)s,
-                        %(instrument_type)s, %(amount_raised)s,
-                        %(pre_money_valuation)s, %(platform)s, %(source)s
-                    )
-                    """,
-                    {
-                        "company_id": company_id,
-                        "round_date": rec.get("filing_date") or rec.get("round_date"),
-                        "round_type": _classify_round_type(rec.get("form_type")),
-                        "instrument_type": _classify_instrument_type(rec.get("form_type")),
-                        "amount_raised": rec.get("amount_raised"),
-                        "pre_money_valuation": rec.get("pre_money_valuation"),
-                        "platform": rec.get("platform"),
-                        "source": "sec_edgar",
-                    },
+    with conn.cursor() as cur:
+        while page:
+            # A multi-row upsert may not touch the same row twice, so collapse
+            # repeated source_ids (last one wins, as sequential upserts would).
+            companies: dict[str, tuple] = {}
+            for rec in page:
+                source_id = rec.get("source_id", "")
+                companies[source_id] = (
+                    rec.get("name"),
+                    rec.get("country", "US"),
+                    rec.get("sector"),
+                    "sec_edgar",
+                    source_id,
+                    rec.get("sic_code"),
                 )
 
-            inserted += 1
+            # Transpose to one list per column for the unnest() upsert
+            columns = [list(col) for col in zip(*companies.values(), strict=True)]
+            cur.execute(_COMPANIES_UPSERT, columns, prepare=True)
+            company_ids = {row["source_id"]: row["id"] for row in cur.fetchall()}
+
+            round_rows: list[tuple] = []
+            for rec in page:
+                company_id = company_ids.get(rec.get("source_id", ""))
+                if company_id is None:
+                    continue
+                inserted += 1
+
+                # Insert funding round if we have financial data
+                if rec.get("funding_target") or rec.get("amount_raised"):
+                    form_type = rec.get("form_type")
+                    round_rows.append((
+                        company_id,
+                        rec.get("filing_date") or rec.get("round_date"),
+                        _classify_round_type(form_type),
+                        _classify_instrument_type(form_type),
+                        rec.get("amount_raised"),
+                        rec.get("pre_money_valuation"),
+                        rec.get("platform"),
+                        "sec_edgar",
+                    ))
+
+            if round_rows:
+                with cur.copy(_FUNDING_ROUNDS_COPY) as copy:
+                    for row in round_rows:
+                        copy.write_row(row)
+
+            page = list(islice(records, batch_size))
 
     conn.commit()
     logger.info("ingested_form_c_batch", inserted=inserted)
@@ -361,7 +460,7 @@ def derive_sec_outcomes(conn: psycopg.Connection) -> int:
     """
     from startuplens.db import execute_query
 
-    inserted_rows = execute_query(
+    rows = execute_query(
         conn,
         """
         WITH form_c AS (
@@ -417,36 +516,43 @@ def derive_sec_outcomes(conn: psycopg.Connection) -> int:
                 fd.cik IS NOT NULL
                 OR fc.campaign_date < CURRENT_DATE - INTERVAL '3 years'
             )
+        ),
+        inserted AS (
+            INSERT INTO crowdfunding_outcomes (
+                company_id, campaign_date, amount_raised, sector, country,
+                outcome, stage_bucket, label_quality_tier, data_source
+            )
+            SELECT
+                company_id, campaign_date, amount_raised, sector, country,
+                outcome, 'seed', label_quality_tier, 'sec_cross_reference'
+            FROM to_insert
+            RETURNING 1
         )
-        INSERT INTO crowdfunding_outcomes (
-            company_id, campaign_date, amount_raised, sector, country,
-            outcome, stage_bucket, label_quality_tier, data_source
-        )
-        SELECT
-            company_id, campaign_date, amount_raised, sector, country,
-            outcome, 'seed', label_quality_tier, 'sec_cross_reference'
-        FROM to_insert
-        RETURNING company_id
+        SELECT COUNT(*) AS cnt FROM inserted
         """,
     )
-    inserted = len(inserted_rows)
+    # Count server-side rather than shipping one row back per insert.
+    inserted = rows[0]["cnt"] if rows else 0
 
     conn.commit()
     logger.info("derived_sec_outcomes", inserted=inserted)
     return inserted
 
 
+# SEC form type -> round_type; anything else (including None) is plain "reg_cf".
+_ROUND_TYPES: dict[str | None, str] = {
+    "C": "reg_cf",
+    "C-U": "reg_cf",
+    "C/A": "reg_cf_amendment",
+    "C-U/A": "reg_cf_amendment",
+    "C-AR": "reg_cf_annual_report",
+    "C-TR": "reg_cf_termination",
+}
+
+
 def _classify_round_type(form_type: str | None) -> str:
     """Map SEC form type to our round_type taxonomy."""
-    if form_type in ("C", "C-U"):
-        return "reg_cf"
-    if form_type in ("C/A", "C-U/A"):
-        return "reg_cf_amendment"
-    if form_type == "C-AR":
-        return "reg_cf_annual_report"
-    if form_type == "C-TR":
-        return "reg_cf_termination"
-    return "reg_cf"
+    return _ROUND_TYPES.get(form_type, "reg_cf")
 
 
 def _classify_instrument_type(form_type: str | None) -> str:
@@ -458,6 +564,26 @@ def _classify_instrument_type(form_type: str | None) -> str:
     return "equity"
 
 
+def _normalize_quarter(
+    filings: Iterable[dict],
+    year: int,
+    quarter: int,
+    summary: dict[str, Any],
+) -> Iterator[dict]:
+    """Normalize parsed filings lazily, counting them into *summary*.
+
+    Records are tagged with the quarter (``{cik}_q{year}Q{quarter}``) for
+    resumability tracking.
+    """
+    suffix = f"_q{year}Q{quarter}"
+    for filing in filings:
+        summary["filings_parsed"] += 1
+        rec = normalize_form_c_record(filing)
+        if rec.get("source_id"):
+            rec["source_id"] += suffix
+        yield rec
+
+
 def run_sec_pipeline(
     conn: psycopg.Connection,
     settings: Settings,
@@ -492,46 +618,47 @@ def run_sec_pipeline(
         "errors": [],
     }
 
+    # Resumability: fetch the already-ingested quarters once, up front
+    ingested = _ingested_quarters(conn)
+
+    pending: list[tuple[int, int]] = []
     for year in years:
         for quarter in (1, 2, 3, 4):
-            quarter_key = f"{year}-Q{quarter}"
-
-            # Resumability: skip already-ingested quarters
-            if _is_quarter_ingested(conn, year, quarter):
-                logger.info("skipping_ingested_quarter", quarter=quarter_key)
+            if (year, quarter) in ingested:
+                logger.info("skipping_ingested_quarter", quarter=f"{year}-Q{quarter}")
                 summary["quarters_skipped"] += 1
-                continue
-
+            else:
+                pending.append((year, quarter))
+
+    # Step 1: download index files on worker threads (network-bound). Parsing
+    # and ingest stay on this thread, in quarter order, since conn is not
+    # shared across threads.
+    with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as pool:
+        downloads = [
+            pool.submit(download_form_c_index, year, quarter, output_dir, settings=settings)
+            for year, quarter in pending
+        ]
+        for (year, quarter), download in zip(pending, downloads, strict=True):
+            quarter_key = f"{year}-Q{quarter}"
             try:
-                # Step 1: Download index
-                index_path = download_form_c_index(
-                    year, quarter, output_dir, settings=settings
-                )
+                index_path = download.result()
 
-                # Step 2: Parse Form C filings from index
-                raw_filings = parse_form_c_filings(index_path)
-                summary["filings_parsed"] += len(raw_filings)
-
-                # Step 3: Normalize each record
-                normalized = [normalize_form_c_record(f) for f in raw_filings]
-
-                # Tag records with quarter for resumability tracking
-                for rec in normalized:
-                    if rec.get("source_id"):
-                        rec["source_id"] = f"{rec['source_id']}_q{year}Q{quarter}"
-
-                # Step 4: Ingest batch
-                count = ingest_form_c_batch(conn, normalized)
+                # Steps 2-4: parse, normalize and ingest as one stream, so only
+                # a page of records is ever held in memory
+                parsed_before = summary["filings_parsed"]
+                records = _normalize_quarter(
+                    parse_form_c_filings_iter(index_path), year, quarter, summary,
+                )
+                count = ingest_form_c_batch(conn, records)
                 summary["records_ingested"] += count
                 summary["quarters_processed"] += 1
 
                 logger.info(
                     "quarter_complete",
                     quarter=quarter_key,
-                    filings=len(raw_filings),
+                    filings=summary["filings_parsed"] - parsed_before,
                     records=count,
                 )
-
             except httpx.HTTPStatusError as e:
                 error_msg = f"{quarter_key}: HTTP {e.response.status_code}"
                 logger.warning("quarter_http_error", quarter=quarter_key, error=error_msg)
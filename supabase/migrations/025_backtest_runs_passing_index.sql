@@ -0,0 +1,7 @@
+-- 025_backtest_runs_passing_index.sql
+-- Partial index for get_passing_runs(): only runs that passed every must-pass
+-- metric, keyed the way the query filters and sorts them.
+
+CREATE INDEX IF NOT EXISTS idx_backtest_runs_passing
+  ON backtest_runs(model_family, run_date DESC)
+  WHERE all_passed = true;
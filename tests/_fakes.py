@@ -0,0 +1,118 @@
+"""Lightweight psycopg stand-ins for tests.
+
+``FakeConn`` / ``FakeCursor`` expose only the connection surface the code
+under test touches and record calls in plain lists, which is much cheaper
+than building nested ``MagicMock`` objects for every test.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+
+class FakeCopy:
+    """``cursor.copy()`` stand-in that collects the rows written to it."""
+
+    __slots__ = ("rows", "statement")
+
+    def __init__(self, statement: str) -> None:
+        self.statement = statement
+        self.rows: list[tuple] = []
+
+    def __enter__(self) -> FakeCopy:
+        return self
+
+    def __exit__(self, *exc: object) -> bool:
+        return False
+
+    def write_row(self, row: tuple) -> None:
+        self.rows.append(tuple(row))
+
+
+class FakeCursor:
+    """Cursor that records executed statements and serves canned rows."""
+
+    __slots__ = (
+        "copies",
+        "description",
+        "executed",
+        "executemany_calls",
+        "fetchmany_sizes",
+        "rowcount",
+        "rows",
+        "_pos",
+    )
+
+    def __init__(self, rows: Iterable[Any] | None = None) -> None:
+        self.rows: list[Any] = list(rows) if rows is not None else []
+        # psycopg only sets description for statements that return rows.
+        self.description: bool | None = True if rows is not None else None
+        self.executed: list[tuple[str, Any]] = []
+        self.executemany_calls: list[tuple[str, list]] = []
+        self.fetchmany_sizes: list[int] = []
+        self.copies: list[FakeCopy] = []
+        self.rowcount = -1
+        self._pos = 0
+
+    def __enter__(self) -> FakeCursor:
+        return self
+
+    def __exit__(self, *exc: object) -> bool:
+        return False
+
+    def execute(self, query: str, params: Any = None, **kwargs: Any) -> FakeCursor:
+        self.executed.append((query, params))
+        return self
+
+    def executemany(self, query: str, params_seq: Iterable[Any]) -> None:
+        params_list = list(params_seq)
+        self.executemany_calls.append((query, params_list))
+        self.rowcount = len(params_list)
+
+    def copy(self, statement: str) -> FakeCopy:
+        self.copies.append(FakeCopy(statement))
+        return self.copies[-1]
+
+    def fetchall(self) -> list[Any]:
+        remaining = self.rows[self._pos :]
+        self._pos = len(self.rows)
+        return remaining
+
+    def fetchone(self) -> Any:
+        if self._pos >= len(self.rows):
+            return None
+        self._pos += 1
+        return self.rows[self._pos - 1]
+
+    def fetchmany(self, size: int) -> list[Any]:
+        self.fetchmany_sizes.append(size)
+        chunk = self.rows[self._pos : self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+
+class FakeConn:
+    """Connection whose ``cursor()`` always hands back the same FakeCursor."""
+
+    __slots__ = ("autocommit", "commits", "cursor_kwargs", "cursor_obj", "rollbacks")
+
+    def __init__(self, rows: Iterable[Any] | None = None, *, autocommit: bool = False) -> None:
+        self.autocommit = autocommit
+        self.cursor_obj = FakeCursor(rows)
+        self.cursor_kwargs: list[dict[str, Any]] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, *args: Any, **kwargs: Any) -> FakeCursor:
+        self.cursor_kwargs.append(kwargs)
+        return self.cursor_obj
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        pass
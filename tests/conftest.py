@@ -1,10 +1,11 @@
-"""Shared fixtures for backtest tests."""
+"""Shared test fixtures."""
 
 from __future__ import annotations
 
 import pytest
 
 from startuplens.backtest.baselines import ScoredDeal
+from tests._fakes import FakeConn
 
 # Sectors and outcomes used to build varied synthetic data
 _SECTORS = ["fintech", "healthtech", "saas", "edtech", "cleantech"]
@@ -12,13 +13,16 @@ _OUTCOMES = ["trading", "exited", "failed"]
 _PLATFORMS = ["seedrs", "crowdcube", "republic", "wefunder"]
 
 
-@pytest.fixture()
-def sample_deals() -> list[ScoredDeal]:
+@pytest.fixture(scope="session")
+def sample_deals() -> tuple[ScoredDeal, ...]:
     """Return 20 synthetic ScoredDeal objects with varied properties.
 
     The deals span campaign dates from 2017 to 2024, rotate through
     five sectors and four platforms, and have a mix of outcomes and
     boolean flags designed to exercise all baseline and simulator logic.
+
+    Built once and shared by every test, so treat the deals as read-only
+    (the baselines already return new ScoredDeal objects).
     """
     deals: list[ScoredDeal] = []
     for i in range(20):
@@ -46,4 +50,10 @@ def sample_deals() -> list[ScoredDeal]:
                 outcome=outcome,
             )
         )
-    return deals
+    return tuple(deals)
+
+
+@pytest.fixture()
+def fake_conn() -> FakeConn:
+    """Return a FakeConn whose cursor records statements and returns no rows."""
+    return FakeConn()
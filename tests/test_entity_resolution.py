@@ -5,13 +5,17 @@ All database interactions are mocked — no real PostgreSQL needed.
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 from startuplens.entity_resolution.deterministic import (
+    _InflightLookups,
     create_canonical_entity,
     link_entity,
     match_by_legal_name,
     match_by_source_id,
+    match_by_source_ids,
     normalize_name,
 )
 from startuplens.entity_resolution.probabilistic import (
@@ -20,6 +24,7 @@ from startuplens.entity_resolution.probabilistic import (
 )
 from startuplens.entity_resolution.resolver import (
     bulk_create_entities,
+    resolve_entities_bulk,
     resolve_entity,
     run_entity_resolution,
 )
@@ -27,6 +32,7 @@ from startuplens.entity_resolution.validation import (
     compute_entity_resolution_metrics,
     generate_validation_report,
 )
+from tests._fakes import FakeConn
 
 # =========================================================================
 # normalize_name
@@ -103,6 +109,81 @@ class TestMatchBySourceId:
             result = match_by_source_id(conn, "sec_edgar", "CIK-9999")
             assert result is None
 
+    def test_lookup_is_prepared(self):
+        conn = MagicMock()
+        with patch(
+            "startuplens.entity_resolution.deterministic.execute_query",
+            return_value=[],
+        ) as mock_eq:
+            match_by_source_id(conn, "sec_edgar", "CIK-0001")
+            assert mock_eq.call_args.kwargs["prepare"] is True
+
+    def test_concurrent_identical_lookups_share_one_query(self):
+        conn = MagicMock()
+        query_started = threading.Event()
+        release_query = threading.Event()
+        follower_waiting = threading.Event()
+
+        class SignallingEvent(threading.Event):
+            """In-flight marker that reports when a second caller waits on it."""
+
+            def wait(self, timeout=None):
+                follower_waiting.set()
+                return super().wait(timeout)
+
+        def blocking_query(*_args, **_kwargs):
+            query_started.set()
+            release_query.wait()
+            return [{"entity_id": "uuid-123"}]
+
+        def lookup():
+            return match_by_source_id(conn, "sec_edgar", "CIK-0001")
+
+        with (
+            patch(
+                "startuplens.entity_resolution.deterministic.execute_query",
+                side_effect=blocking_query,
+            ) as mock_eq,
+            patch(
+                "startuplens.entity_resolution.deterministic._source_id_lookups",
+                _InflightLookups(event_factory=SignallingEvent),
+            ),
+            ThreadPoolExecutor(max_workers=2) as pool,
+        ):
+            leader = pool.submit(lookup)
+            assert query_started.wait(timeout=5)
+            follower = pool.submit(lookup)
+            # The timeout only stops a regression from hanging the suite.
+            follower_blocked = follower_waiting.wait(timeout=5)
+            release_query.set()
+            assert follower_blocked
+            assert leader.result() == follower.result() == "uuid-123"
+            mock_eq.assert_called_once()
+
+
+class TestMatchBySourceIds:
+    """Tests for batched source-ID lookup."""
+
+    def test_maps_found_pairs_and_omits_misses(self):
+        conn = MagicMock()
+        with patch(
+            "startuplens.entity_resolution.deterministic.execute_query",
+            return_value=[{"source": "ch", "source_identifier": "1", "entity_id": "uuid-1"}],
+        ) as mock_eq:
+            found = match_by_source_ids(conn, [("ch", "1"), ("sec", "A"), ("ch", "1")])
+            assert found == {("ch", "1"): "uuid-1"}
+            mock_eq.assert_called_once()
+            assert mock_eq.call_args[0][2] == ("ch", "1", "sec", "A")
+
+    def test_splits_into_batches(self):
+        conn = MagicMock()
+        with patch(
+            "startuplens.entity_resolution.deterministic.execute_query",
+            return_value=[],
+        ) as mock_eq:
+            match_by_source_ids(conn, [("ch", str(i)) for i in range(5)], batch_size=2)
+            assert mock_eq.call_count == 3
+
 
 # =========================================================================
 # match_by_legal_name
@@ -196,17 +277,15 @@ class TestLinkEntity:
 class TestResolveEntity:
     """Tests for the deterministic resolution orchestrator."""
 
-    def test_returns_existing_on_source_id_match(self):
-        conn = MagicMock()
+    def test_returns_existing_on_source_id_match(self, fake_conn):
         with patch(
             "startuplens.entity_resolution.resolver.match_by_source_id",
             return_value="existing-uuid",
         ):
-            result = resolve_entity(conn, "Acme", "GB", "sec_edgar", "CIK-001")
+            result = resolve_entity(fake_conn, "Acme", "GB", "sec_edgar", "CIK-001")
             assert result == "existing-uuid"
 
-    def test_matches_by_name_when_source_id_misses(self):
-        conn = MagicMock()
+    def test_matches_by_name_when_source_id_misses(self, fake_conn):
         with (
             patch(
                 "startuplens.entity_resolution.resolver.match_by_source_id",
@@ -220,12 +299,11 @@ class TestResolveEntity:
                 "startuplens.entity_resolution.resolver.link_entity",
             ) as mock_link,
         ):
-            result = resolve_entity(conn, "Acme Ltd", "GB", "sec_edgar", "CIK-002")
+            result = resolve_entity(fake_conn, "Acme Ltd", "GB", "sec_edgar", "CIK-002")
             assert result == "name-match-uuid"
             mock_link.assert_called_once()
 
-    def test_creates_new_entity_when_no_match(self):
-        conn = MagicMock()
+    def test_creates_new_entity_when_no_match(self, fake_conn):
         with (
             patch(
                 "startuplens.entity_resolution.resolver.match_by_source_id",
@@ -243,9 +321,9 @@ class TestResolveEntity:
                 "startuplens.entity_resolution.resolver.link_entity",
             ) as mock_link,
         ):
-            result = resolve_entity(conn, "NewCo", "US", "sec_edgar", "CIK-003")
+            result = resolve_entity(fake_conn, "NewCo", "US", "sec_edgar", "CIK-003")
             assert result == "new-uuid"
-            mock_create.assert_called_once_with(conn, "NewCo", "US")
+            mock_create.assert_called_once_with(fake_conn, "NewCo", "US")
             mock_link.assert_called_once()
 
 
@@ -257,57 +335,79 @@ class TestResolveEntity:
 class TestRunEntityResolution:
     """Tests for batch deterministic resolution."""
 
-    def test_batch_stats_all_new(self):
-        conn = MagicMock()
+    def test_batch_stats_all_new(self, fake_conn):
         records = [
             {"name": "Alpha", "country": "GB", "source": "ch", "source_identifier": "1"},
             {"name": "Beta", "country": "US", "source": "sec", "source_identifier": "2"},
         ]
-        with (
-            patch(
-                "startuplens.entity_resolution.resolver.match_by_source_id",
-                return_value=None,
-            ),
-            patch(
-                "startuplens.entity_resolution.resolver.match_by_legal_name",
-                return_value=None,
-            ),
-            patch(
-                "startuplens.entity_resolution.resolver.resolve_entity",
-                return_value="new-id",
-            ),
-        ):
-            stats = run_entity_resolution(conn, records)
+        with patch(
+            "startuplens.entity_resolution.resolver.execute_query",
+            return_value=[],
+        ) as mock_eq:
+            stats = run_entity_resolution(fake_conn, records)
             assert stats["created"] == 2
             assert stats["matched"] == 0
             assert stats["total"] == 2
+            # links SELECT, name SELECT, entities INSERT, links INSERT
+            assert mock_eq.call_count == 4
 
-    def test_batch_stats_all_matched(self):
-        conn = MagicMock()
+    def test_batch_stats_all_matched(self, fake_conn):
         records = [
             {"name": "Alpha", "country": "GB", "source": "ch", "source_identifier": "1"},
         ]
-        with (
-            patch(
-                "startuplens.entity_resolution.resolver.match_by_source_id",
-                return_value="existing-id",
-            ),
-            patch(
-                "startuplens.entity_resolution.resolver.resolve_entity",
-                return_value="existing-id",
-            ),
-        ):
-            stats = run_entity_resolution(conn, records)
+        with patch(
+            "startuplens.entity_resolution.resolver.execute_query",
+            return_value=[{"source": "ch", "source_identifier": "1", "entity_id": "existing-id"}],
+        ) as mock_eq:
+            stats = run_entity_resolution(fake_conn, records)
             assert stats["matched"] == 1
             assert stats["created"] == 0
             assert stats["total"] == 1
+            mock_eq.assert_called_once()
 
-    def test_empty_batch(self):
-        conn = MagicMock()
-        stats = run_entity_resolution(conn, [])
+    def test_empty_batch(self, fake_conn):
+        stats = run_entity_resolution(fake_conn, [])
         assert stats == {"matched": 0, "created": 0, "total": 0}
 
 
+class TestResolveEntitiesBulk:
+    """Tests for the batched resolution path."""
+
+    def test_name_match_links_with_deterministic_confidence(self, fake_conn):
+        records = [
+            {"name": "Acme Ltd", "country": "GB", "source": "ch", "source_identifier": "1"},
+        ]
+        with patch(
+            "startuplens.entity_resolution.resolver.execute_query",
+            side_effect=[
+                [],
+                [{"entity_id": "name-uuid", "primary_name": "acme", "country": "gb"}],
+                [],
+            ],
+        ) as mock_eq:
+            entity_ids, created = resolve_entities_bulk(fake_conn, records)
+            assert entity_ids == ["name-uuid"]
+            assert created == 0
+            link_sql, link_params = mock_eq.call_args[0][1:]
+            assert "INSERT INTO entity_links" in link_sql
+            assert link_params[1] == "name-uuid"
+            assert link_params[5] == "deterministic"
+            assert link_params[6] == 90
+
+    def test_repeated_name_reuses_first_created_entity(self, fake_conn):
+        records = [
+            {"name": "Acme Ltd", "country": "GB", "source": "ch", "source_identifier": "1"},
+            {"name": "ACME Limited", "country": "gb", "source": "sec", "source_identifier": "A"},
+        ]
+        with patch(
+            "startuplens.entity_resolution.resolver.execute_query",
+            return_value=[],
+        ):
+            entity_ids, created = resolve_entities_bulk(fake_conn, records)
+            assert created == 1
+            assert entity_ids[0] == entity_ids[1]
+
+
 # =========================================================================
 # bulk_create_entities
 # =========================================================================
@@ -317,10 +417,7 @@ class TestBulkCreateEntities:
     """Tests for bulk entity creation (Form D style)."""
 
     def test_creates_entities_for_new_records(self):
-        conn = MagicMock()
-        cursor = MagicMock()
-        conn.cursor.return_value.__enter__ = lambda s: cursor
-        conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+        conn = FakeConn()
 
         records = [
             {
@@ -343,10 +440,7 @@ class TestBulkCreateEntities:
             assert stats["total"] == 2
 
     def test_skips_already_linked_records(self):
-        conn = MagicMock()
-        cursor = MagicMock()
-        conn.cursor.return_value.__enter__ = lambda s: cursor
-        conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+        conn = FakeConn()
 
         records = [
             {
@@ -377,10 +471,7 @@ class TestBulkCreateEntities:
 
     def test_deduplicates_within_batch(self):
         """Duplicate (source, source_identifier) pairs in the same batch are deduped."""
-        conn = MagicMock()
-        cursor = MagicMock()
-        conn.cursor.return_value.__enter__ = lambda s: cursor
-        conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+        conn = FakeConn()
 
         records = [
             {
@@ -406,10 +497,7 @@ class TestBulkCreateEntities:
             assert stats["total"] == 3
 
     def test_respects_batch_size(self):
-        conn = MagicMock()
-        cursor = MagicMock()
-        conn.cursor.return_value.__enter__ = lambda s: cursor
-        conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+        conn = FakeConn()
 
         records = [
             {
@@ -447,21 +535,17 @@ class TestMergeEntities:
             # 2 DELETEs (feature_store, backtest_holdout) +
             # 6 UPDATEs (entity_links, companies, evaluations,
             #   investments, anti_portfolio, deal_funnel) +
-            # 1 DELETE (canonical_entities)
-            assert mock_eq.call_count == 9
-
-            # Verify entity_links is updated
-            update_calls = [
-                c for c in mock_eq.call_args_list
-                if "UPDATE entity_links" in c[0][1]
-            ]
-            assert len(update_calls) == 1
-            assert update_calls[0][0][2] == ("keep-uuid", "merge-uuid")
-
-            # Last call: DELETE canonical_entities
-            delete_call = mock_eq.call_args_list[-1]
-            assert "DELETE FROM canonical_entities" in delete_call[0][1]
-            assert delete_call[0][2] == ("merge-uuid",)
+            # 1 DELETE (canonical_entities), all in one statement
+            mock_eq.assert_called_once()
+            sql, params = mock_eq.call_args[0][1:]
+            assert sql.count("DELETE FROM") == 3
+            assert sql.count("UPDATE ") == 6
+            assert "UPDATE entity_links SET entity_id = %s WHERE entity_id = %s" in sql
+            assert sql.rstrip().endswith("DELETE FROM canonical_entities WHERE id = %s")
+            assert sql.count("%s") == len(params)
+            assert params[:2] == ("merge-uuid", "merge-uuid")
+            assert params[2:4] == ("keep-uuid", "merge-uuid")
+            assert params[-1] == "merge-uuid"
 
 
 # =========================================================================
@@ -473,20 +557,26 @@ class TestBuildTrainingPairs:
     """Tests for training data extraction."""
 
     def test_returns_name_country_dicts(self):
-        conn = MagicMock()
-        rows = [
+        conn = FakeConn(rows=[
             {"entity_id": "e1", "primary_name": "acme", "country": "gb"},
             {"entity_id": "e2", "primary_name": "beta co", "country": "us"},
-        ]
-        with patch(
-            "startuplens.entity_resolution.probabilistic.execute_query",
-            return_value=rows,
-        ):
-            pairs = build_training_pairs(conn)
-            assert len(pairs) == 2
-            assert pairs[0]["name"] == "acme"
-            assert pairs[0]["country"] == "gb"
-            assert pairs[1]["entity_id"] == "e2"
+        ])
+        pairs = build_training_pairs(conn)
+        assert len(pairs) == 2
+        assert pairs[0]["name"] == "acme"
+        assert pairs[0]["country"] == "gb"
+        assert pairs[1]["entity_id"] == "e2"
+
+    def test_streams_in_chunks_from_server_side_cursor(self):
+        conn = FakeConn(rows=[
+            {"entity_id": "e1", "primary_name": "acme", "country": "gb"},
+            {"entity_id": "e2", "primary_name": "beta co", "country": "us"},
+        ])
+        pairs = build_training_pairs(conn, chunk_size=1)
+        assert [p["entity_id"] for p in pairs] == ["e1", "e2"]
+        assert conn.cursor_kwargs[0]["name"]
+        assert conn.cursor_obj.fetchmany_sizes
+        assert set(conn.cursor_obj.fetchmany_sizes) == {1}
 
 
 # =========================================================================
@@ -494,6 +584,14 @@ class TestBuildTrainingPairs:
 # =========================================================================
 
 
+def _batched(lookup_one):
+    """Adapt a per-record lookup side effect to ``match_by_source_ids``."""
+    def lookup_many(conn, keys):
+        found = {key: lookup_one(conn, *key) for key in keys}
+        return {key: entity_id for key, entity_id in found.items() if entity_id is not None}
+    return lookup_many
+
+
 class TestComputeMetrics:
     """Tests for precision/recall/F1 computation."""
 
@@ -522,8 +620,8 @@ class TestComputeMetrics:
 
         conn = MagicMock()
         with patch(
-            "startuplens.entity_resolution.validation.match_by_source_id",
-            side_effect=side_effect,
+            "startuplens.entity_resolution.validation.match_by_source_ids",
+            side_effect=_batched(side_effect),
         ):
             metrics = compute_entity_resolution_metrics(conn, ground_truth)
             assert metrics["precision"] == 1.0
@@ -542,8 +640,8 @@ class TestComputeMetrics:
 
         conn = MagicMock()
         with patch(
-            "startuplens.entity_resolution.validation.match_by_source_id",
-            side_effect=side_effect,
+            "startuplens.entity_resolution.validation.match_by_source_ids",
+            side_effect=_batched(side_effect),
         ):
             metrics = compute_entity_resolution_metrics(conn, ground_truth)
             assert metrics["false_positives"] == 1
@@ -561,8 +659,8 @@ class TestComputeMetrics:
 
         conn = MagicMock()
         with patch(
-            "startuplens.entity_resolution.validation.match_by_source_id",
-            side_effect=side_effect,
+            "startuplens.entity_resolution.validation.match_by_source_ids",
+            side_effect=_batched(side_effect),
         ):
             metrics = compute_entity_resolution_metrics(conn, ground_truth)
             assert metrics["false_negatives"] == 1
@@ -581,12 +679,34 @@ class TestComputeMetrics:
 
         conn = MagicMock()
         with patch(
-            "startuplens.entity_resolution.validation.match_by_source_id",
-            side_effect=side_effect,
+            "startuplens.entity_resolution.validation.match_by_source_ids",
+            side_effect=_batched(side_effect),
         ):
             metrics = compute_entity_resolution_metrics(conn, ground_truth)
             assert metrics["false_negatives"] == 1
 
+    def test_distinct_records_sharing_an_entity_compare_equal(self):
+        """Different source records resolving to one UUID count as the same entity."""
+        ground_truth = [
+            self._make_pair("ch", "1", "sec", "A", same=True),
+            self._make_pair("ch", "2", "sec", "A", same=True),
+            self._make_pair("ch", "3", "sec", "B", same=False),
+        ]
+        lookup = {
+            ("ch", "1"): "uuid-1", ("sec", "A"): "uuid-1", ("ch", "2"): "uuid-1",
+            ("ch", "3"): "uuid-2", ("sec", "B"): "uuid-3",
+        }
+
+        conn = MagicMock()
+        with patch(
+            "startuplens.entity_resolution.validation.match_by_source_ids",
+            side_effect=_batched(lambda _conn, *key: lookup.get(key)),
+        ):
+            metrics = compute_entity_resolution_metrics(conn, ground_truth)
+            assert metrics["true_positives"] == 2
+            assert metrics["false_positives"] == 0
+            assert metrics["false_negatives"] == 0
+
     def test_empty_ground_truth(self):
         conn = MagicMock()
         metrics = compute_entity_resolution_metrics(conn, [])
@@ -647,3 +767,10 @@ class TestGenerateValidationReport:
         assert "Precision:" in report
         assert "Recall:" in report
         assert "F1 Score:" in report
+
+    def test_assessment_band_edges_are_inclusive(self):
+        base = {"precision": 0.0, "recall": 0.0}
+        assert "EXCELLENT" in generate_validation_report({**base, "f1": 0.95})
+        assert "GOOD" in generate_validation_report({**base, "f1": 0.85})
+        assert "FAIR" in generate_validation_report({**base, "f1": 0.70})
+        assert "POOR" in generate_validation_report({**base, "f1": 0.6999})
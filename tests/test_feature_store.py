@@ -7,17 +7,19 @@ from __future__ import annotations
 
 import json
 from datetime import date
-from unittest.mock import MagicMock
+from decimal import Decimal
 
 import pytest
 
 from startuplens.feature_store.extractors.campaign import extract_campaign_features
-from startuplens.feature_store.extractors.company import extract_company_features
+from startuplens.feature_store.extractors.company import _parse_iso, extract_company_features
 from startuplens.feature_store.extractors.financial import extract_financial_features
 from startuplens.feature_store.extractors.market_regime import extract_market_regime_features
 from startuplens.feature_store.extractors.regulatory import extract_regulatory_features
 from startuplens.feature_store.extractors.team import extract_team_features
 from startuplens.feature_store.extractors.terms import extract_terms_features
+from startuplens.feature_store.pipeline import run_extractors_bulk
+from startuplens.feature_store.registry import is_valid_feature
 from startuplens.feature_store.store import (
     read_features_as_of,
     read_training_matrix,
@@ -25,19 +27,17 @@ from startuplens.feature_store.store import (
     write_feature,
     write_features_batch,
 )
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _mock_conn() -> MagicMock:
-    """Create a mock psycopg connection with cursor context manager."""
-    conn = MagicMock()
-    cursor = MagicMock()
-    conn.cursor.return_value.__enter__ = MagicMock(return_value=cursor)
-    conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
-    return conn
-
+from tests._fakes import FakeConn
+
+_EXTRACTORS = (
+    extract_campaign_features,
+    extract_company_features,
+    extract_financial_features,
+    extract_team_features,
+    extract_terms_features,
+    extract_regulatory_features,
+    extract_market_regime_features,
+)
 
 # ===========================================================================
 # Store: validate_feature_write
@@ -63,6 +63,9 @@ class TestValidateFeatureWrite:
     def test_wrong_dtype_numeric_gets_string(self):
         assert validate_feature_write("funding_target", "not a number") is False
 
+    def test_wrong_dtype_numeric_gets_bool(self):
+        assert validate_feature_write("funding_target", True) is False
+
     def test_wrong_dtype_boolean_gets_int(self):
         assert validate_feature_write("eis_seis_eligible", 1) is False
 
@@ -79,20 +82,17 @@ class TestValidateFeatureWrite:
 
 
 class TestWriteFeature:
-    def test_writes_valid_feature(self):
-        conn = _mock_conn()
+    def test_writes_valid_feature(self, fake_conn):
         write_feature(
-            conn,
+            fake_conn,
             entity_id="abc-123",
             feature_name="funding_target",
             value=50000,
             as_of_date=date(2024, 1, 15),
             source="seedrs_scrape",
         )
-        cursor = conn.cursor.return_value.__enter__.return_value
-        cursor.execute.assert_called_once()
-        args = cursor.execute.call_args
-        params = args[0][1]
+        assert len(fake_conn.cursor_obj.executed) == 1
+        params = fake_conn.cursor_obj.executed[0][1]
         assert params[0] == "abc-123"
         assert params[1] == date(2024, 1, 15)
         assert params[2] == "campaign"  # family from registry
@@ -101,11 +101,10 @@ class TestWriteFeature:
         assert params[5] == "seedrs_scrape"
         assert params[6] == 3  # default tier
 
-    def test_rejects_unknown_feature(self):
-        conn = _mock_conn()
+    def test_rejects_unknown_feature(self, fake_conn):
         with pytest.raises(ValueError, match="Unknown feature"):
             write_feature(
-                conn,
+                fake_conn,
                 entity_id="abc-123",
                 feature_name="totally_fake",
                 value=42,
@@ -113,10 +112,9 @@ class TestWriteFeature:
                 source="test",
             )
 
-    def test_custom_label_tier(self):
-        conn = _mock_conn()
+    def test_custom_label_tier(self, fake_conn):
         write_feature(
-            conn,
+            fake_conn,
             entity_id="abc-123",
             feature_name="sector",
             value="fintech",
@@ -124,24 +122,33 @@ class TestWriteFeature:
             source="companies_house",
             label_tier=1,
         )
-        cursor = conn.cursor.return_value.__enter__.return_value
-        params = cursor.execute.call_args[0][1]
+        params = fake_conn.cursor_obj.executed[-1][1]
         assert params[6] == 1
 
-    def test_boolean_feature_stored_as_jsonb(self):
-        conn = _mock_conn()
+    def test_boolean_feature_stored_as_jsonb(self, fake_conn):
         write_feature(
-            conn,
+            fake_conn,
             entity_id="abc-123",
             feature_name="eis_seis_eligible",
             value=True,
             as_of_date=date(2024, 1, 1),
             source="test",
         )
-        cursor = conn.cursor.return_value.__enter__.return_value
-        params = cursor.execute.call_args[0][1]
+        params = fake_conn.cursor_obj.executed[-1][1]
         assert json.loads(params[4]) == {"value": True}
 
+    def test_decimal_feature_stored_as_float(self, fake_conn):
+        write_feature(
+            fake_conn,
+            entity_id="abc-123",
+            feature_name="overfunding_ratio",
+            value=Decimal("1.25"),
+            as_of_date=date(2024, 1, 1),
+            source="test",
+        )
+        params = fake_conn.cursor_obj.executed[-1][1]
+        assert json.loads(params[4]) == {"value": 1.25}
+
 
 # ===========================================================================
 # Store: write_features_batch
@@ -149,33 +156,30 @@ class TestWriteFeature:
 
 
 class TestWriteFeaturesBatch:
-    def test_batch_writes_multiple_features(self):
-        conn = _mock_conn()
+    def test_batch_writes_multiple_features(self, fake_conn):
         features = {
             "funding_target": 100000,
             "amount_raised": 120000,
             "platform": "seedrs",
         }
         count = write_features_batch(
-            conn,
+            fake_conn,
             entity_id="entity-001",
             features=features,
             as_of_date=date(2024, 3, 1),
             source="batch_import",
         )
         assert count == 3
-        cursor = conn.cursor.return_value.__enter__.return_value
-        cursor.executemany.assert_called_once()
+        assert len(fake_conn.cursor_obj.executemany_calls) == 1
 
-    def test_batch_skips_none_values(self):
-        conn = _mock_conn()
+    def test_batch_skips_none_values(self, fake_conn):
         features = {
             "funding_target": 100000,
             "amount_raised": None,
             "platform": "seedrs",
         }
         count = write_features_batch(
-            conn,
+            fake_conn,
             entity_id="entity-001",
             features=features,
             as_of_date=date(2024, 3, 1),
@@ -183,21 +187,31 @@ class TestWriteFeaturesBatch:
         )
         assert count == 2
 
-    def test_batch_rejects_unknown_features(self):
-        conn = _mock_conn()
+    def test_batch_rejects_unknown_features(self, fake_conn):
         with pytest.raises(ValueError, match="Unknown features"):
             write_features_batch(
-                conn,
+                fake_conn,
                 entity_id="entity-001",
                 features={"fake_feature": 42},
                 as_of_date=date(2024, 1, 1),
                 source="test",
             )
 
-    def test_batch_empty_after_nones_returns_zero(self):
-        conn = _mock_conn()
+    def test_batch_rejects_bad_values_when_validating(self, fake_conn):
+        with pytest.raises(ValueError, match="Invalid feature values"):
+            write_features_batch(
+                fake_conn,
+                entity_id="entity-001",
+                features={"funding_target": "lots", "platform": "seedrs"},
+                as_of_date=date(2024, 1, 1),
+                source="test",
+                validate_values=True,
+            )
+        assert fake_conn.cursor_obj.executemany_calls == []
+
+    def test_batch_empty_after_nones_returns_zero(self, fake_conn):
         count = write_features_batch(
-            conn,
+            fake_conn,
             entity_id="entity-001",
             features={"funding_target": None, "amount_raised": None},
             as_of_date=date(2024, 1, 1),
@@ -214,40 +228,31 @@ class TestWriteFeaturesBatch:
 class TestReadFeaturesAsOf:
     def test_returns_most_recent_before_date(self):
         """Temporal correctness: returns only data on or before as_of_date."""
-        conn = _mock_conn()
-        cursor = conn.cursor.return_value.__enter__.return_value
-        cursor.description = True
-        cursor.fetchall.return_value = [
-            {"feature_name": "funding_target", "feature_value": {"value": 50000}},
-            {"feature_name": "sector", "feature_value": {"value": "fintech"}},
-        ]
+        conn = FakeConn(rows=[
+            ("funding_target", {"value": 50000}),
+            ("sector", {"value": "fintech"}),
+        ])
 
         result = read_features_as_of(conn, "entity-001", date(2024, 6, 1))
 
         assert result == {"funding_target": 50000, "sector": "fintech"}
         # Verify the SQL uses <= for temporal correctness
-        sql = cursor.execute.call_args[0][0]
+        sql = conn.cursor_obj.executed[0][0]
         assert "<=" in sql
-        params = cursor.execute.call_args[0][1]
+        params = conn.cursor_obj.executed[0][1]
         assert params == ("entity-001", date(2024, 6, 1))
 
     def test_returns_empty_when_no_features(self):
-        conn = _mock_conn()
-        cursor = conn.cursor.return_value.__enter__.return_value
-        cursor.description = True
-        cursor.fetchall.return_value = []
+        conn = FakeConn(rows=[])
 
         result = read_features_as_of(conn, "entity-001", date(2020, 1, 1))
         assert result == {}
 
     def test_handles_string_jsonb(self):
         """Handles case where psycopg returns JSONB as string."""
-        conn = _mock_conn()
-        cursor = conn.cursor.return_value.__enter__.return_value
-        cursor.description = True
-        cursor.fetchall.return_value = [
-            {"feature_name": "platform", "feature_value": '{"value": "crowdcube"}'},
-        ]
+        conn = FakeConn(rows=[
+            ("platform", '{"value": "crowdcube"}'),
+        ])
 
         result = read_features_as_of(conn, "entity-001", date(2024, 6, 1))
         assert result == {"platform": "crowdcube"}
@@ -260,14 +265,10 @@ class TestReadFeaturesAsOf:
 
 class TestReadTrainingMatrix:
     def test_returns_wide_format(self):
-        conn = _mock_conn()
-        cursor = conn.cursor.return_value.__enter__.return_value
-        cursor.description = True
-        cursor.fetchall.return_value = [
-            {"entity_id": "e1", "feature_name": "funding_target", "feature_value": {"value": 100}},
-            {"entity_id": "e1", "feature_name": "sector", "feature_value": {"value": "saas"}},
-            {"entity_id": "e2", "feature_name": "funding_target", "feature_value": {"value": 200}},
-        ]
+        conn = FakeConn(rows=[
+            ("e1", {"funding_target": 100, "sector": "saas"}),
+            ("e2", {"funding_target": 200}),
+        ])
 
         result = read_training_matrix(conn, date(2024, 6, 1))
 
@@ -277,16 +278,24 @@ class TestReadTrainingMatrix:
         assert e1["sector"] == "saas"
         e2 = [r for r in result if r["entity_id"] == "e2"][0]
         assert e2["funding_target"] == 200
+        # Pivot happens in SQL, not in Python
+        sql = conn.cursor_obj.executed[0][0]
+        assert "jsonb_object_agg" in sql
+
+    def test_handles_string_jsonb(self):
+        conn = FakeConn(rows=[
+            ("e1", '{"platform": "crowdcube"}'),
+        ])
+
+        result = read_training_matrix(conn, date(2024, 6, 1))
+        assert result == [{"entity_id": "e1", "platform": "crowdcube"}]
 
     def test_passes_label_tier_filter(self):
-        conn = _mock_conn()
-        cursor = conn.cursor.return_value.__enter__.return_value
-        cursor.description = True
-        cursor.fetchall.return_value = []
+        conn = FakeConn(rows=[])
 
         read_training_matrix(conn, date(2024, 6, 1), min_label_tier=1)
 
-        params = cursor.execute.call_args[0][1]
+        params = conn.cursor_obj.executed[0][1]
         assert params[1] == 1  # min_label_tier passed to SQL
 
 
@@ -399,6 +408,18 @@ class TestCompanyExtractor:
         features = extract_company_features(record)
         assert features["company_age_months"] == 0
 
+    def test_parse_iso_caches_repeated_dates(self):
+        _parse_iso.cache_clear()
+        assert _parse_iso("2024-01-15") == _parse_iso("2024-01-15") == date(2024, 1, 15)
+        assert _parse_iso.cache_info().hits == 1
+
+    def test_parse_iso_does_not_cache_errors(self):
+        _parse_iso.cache_clear()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                _parse_iso("not-a-date")
+        assert _parse_iso.cache_info().currsize == 0
+
 
 # ===========================================================================
 # Extractor: Financial
@@ -553,15 +574,8 @@ class TestFeatureStoreIntegration:
             "total_debt": 100000,
         }
         all_features: dict = {}
-        all_features.update(extract_campaign_features(sample_record))
-        all_features.update(extract_company_features(sample_record))
-        all_features.update(extract_financial_features(sample_record))
-        all_features.update(extract_team_features(sample_record))
-        all_features.update(extract_terms_features(sample_record))
-        all_features.update(extract_regulatory_features(sample_record))
-        all_features.update(extract_market_regime_features(sample_record))
-
-        from startuplens.feature_store.registry import is_valid_feature
+        for extractor in _EXTRACTORS:
+            all_features |= extractor(sample_record)
 
         for name in all_features:
             assert is_valid_feature(name), f"Extractor returned unregistered feature: {name}"
@@ -571,3 +585,33 @@ class TestFeatureStoreIntegration:
         assert validate_feature_write("funding_target", "bad") is False
         assert validate_feature_write("eis_seis_eligible", 0) is False
         assert validate_feature_write("platform", 123) is False
+
+
+# ===========================================================================
+# Pipeline: run_extractors_bulk
+# ===========================================================================
+
+
+class TestRunExtractorsBulk:
+    _RECORDS = [
+        {"founder_count": 2, "funding_target": 100000, "amount_raised": 150000},
+        {"founder_count": 1, "revenue_at_raise": 0},
+        {"sector": "fintech"},
+    ]
+
+    def test_serial_matches_individual_extractors(self):
+        results = run_extractors_bulk(self._RECORDS, ["team", "campaign"])
+        assert len(results) == 3
+        for record, result in zip(self._RECORDS, results, strict=True):
+            assert list(result) == ["team", "campaign"]
+            assert result["team"] == extract_team_features(record)
+            assert result["campaign"] == extract_campaign_features(record)
+
+    def test_parallel_preserves_order(self):
+        serial = run_extractors_bulk(self._RECORDS)
+        parallel = run_extractors_bulk(self._RECORDS, max_workers=2, parallel_threshold=1)
+        assert parallel == serial
+
+    def test_rejects_unknown_family(self):
+        with pytest.raises(ValueError, match="Unknown extractor families"):
+            run_extractors_bulk(self._RECORDS, ["nonexistent"])
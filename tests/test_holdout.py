@@ -1,131 +1,145 @@
 """Tests for holdout quarantine manager."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+import pytest
 
 from startuplens.backtest.holdout import (
+    _COPY_THRESHOLD,
     filter_training_entities,
     get_holdout_entity_ids,
     get_holdout_summary,
     is_entity_held_out,
     quarantine_holdout,
 )
+from tests._fakes import FakeConn, FakeCursor
+
+
+@pytest.fixture
+def mock_execute_many():
+    """Patch ``execute_many`` in the holdout module; set ``return_value`` per test."""
+    with patch("startuplens.backtest.holdout.execute_many", return_value=0) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_execute_query():
+    """Patch ``execute_query`` in the holdout module; set ``return_value`` per test."""
+    with patch("startuplens.backtest.holdout.execute_query", return_value=[]) as mock:
+        yield mock
 
 
 class TestQuarantineHoldout:
-    def test_inserts_correct_number_of_rows(self):
-        conn = MagicMock()
-        with patch("startuplens.backtest.holdout.execute_many", return_value=3) as mock:
-            result = quarantine_holdout(
-                conn,
-                entity_ids=["e1", "e2", "e3"],
-                window_label="2023-2025",
-            )
+    def test_inserts_correct_number_of_rows(self, fake_conn, mock_execute_many):
+        mock_execute_many.return_value = 3
+        result = quarantine_holdout(
+            fake_conn,
+            entity_ids=["e1", "e2", "e3"],
+            window_label="2023-2025",
+        )
         assert result == 3
-        mock.assert_called_once()
-        args = mock.call_args
+        mock_execute_many.assert_called_once()
+        args = mock_execute_many.call_args
         assert len(args[0][2]) == 3  # 3 param tuples
 
-    def test_sets_company_ids_to_none_when_omitted(self):
-        conn = MagicMock()
-        with patch("startuplens.backtest.holdout.execute_many", return_value=2) as mock:
-            quarantine_holdout(conn, ["e1", "e2"], "2023-2025")
-        rows = mock.call_args[0][2]
+    def test_sets_company_ids_to_none_when_omitted(self, fake_conn, mock_execute_many):
+        quarantine_holdout(fake_conn, ["e1", "e2"], "2023-2025")
+        rows = mock_execute_many.call_args[0][2]
         assert all(row[2] is None for row in rows)
 
-    def test_uses_provided_company_ids(self):
-        conn = MagicMock()
-        with patch("startuplens.backtest.holdout.execute_many", return_value=2) as mock:
-            quarantine_holdout(conn, ["e1", "e2"], "2023-2025", company_ids=["c1", "c2"])
-        rows = mock.call_args[0][2]
+    def test_uses_provided_company_ids(self, fake_conn, mock_execute_many):
+        quarantine_holdout(fake_conn, ["e1", "e2"], "2023-2025", company_ids=["c1", "c2"])
+        rows = mock_execute_many.call_args[0][2]
         assert rows[0][2] == "c1"
         assert rows[1][2] == "c2"
 
-    def test_empty_entity_ids_returns_zero(self):
-        conn = MagicMock()
-        result = quarantine_holdout(conn, [], "2023-2025")
+    def test_empty_entity_ids_returns_zero(self, fake_conn, mock_execute_many):
+        result = quarantine_holdout(fake_conn, [], "2023-2025")
         assert result == 0
+        mock_execute_many.assert_not_called()
 
-    def test_window_label_in_all_rows(self):
-        conn = MagicMock()
-        with patch("startuplens.backtest.holdout.execute_many", return_value=2) as mock:
-            quarantine_holdout(conn, ["e1", "e2"], "2023-2025")
-        rows = mock.call_args[0][2]
+    def test_window_label_in_all_rows(self, fake_conn, mock_execute_many):
+        quarantine_holdout(fake_conn, ["e1", "e2"], "2023-2025")
+        rows = mock_execute_many.call_args[0][2]
         assert all(row[3] == "2023-2025" for row in rows)
 
-    def test_each_row_has_unique_uuid(self):
-        conn = MagicMock()
-        with patch("startuplens.backtest.holdout.execute_many", return_value=3) as mock:
-            quarantine_holdout(conn, ["e1", "e2", "e3"], "2023-2025")
-        rows = mock.call_args[0][2]
+    def test_each_row_has_unique_uuid(self, fake_conn, mock_execute_many):
+        quarantine_holdout(fake_conn, ["e1", "e2", "e3"], "2023-2025")
+        rows = mock_execute_many.call_args[0][2]
         uuids = [row[0] for row in rows]
         assert len(set(uuids)) == 3
+        assert all(u.version == 4 for u in uuids)
+
+    def test_large_batch_streams_through_copy(self, fake_conn, mock_execute_many):
+        entity_ids = [f"e{i}" for i in range(_COPY_THRESHOLD)]
+        quarantine_holdout(fake_conn, entity_ids, "2023-2025")
+
+        mock_execute_many.assert_not_called()
+        cur = fake_conn.cursor_obj
+        assert len(cur.copies) == 1
+        assert [row[1] for row in cur.copies[0].rows] == entity_ids
+        statements = [q for q, _ in cur.executed]
+        assert any("ON CONFLICT (entity_id, holdout_window) DO NOTHING" in q for q in statements)
+        assert statements[-1] == "DROP TABLE _holdout_stage"
+
+    def test_failed_copy_drops_stage_table_in_autocommit(self, mock_execute_many):
+        conn = FakeConn(autocommit=True)
+        entity_ids = [f"e{i}" for i in range(_COPY_THRESHOLD)]
+
+        with (
+            patch.object(FakeCursor, "copy", side_effect=RuntimeError("copy failed")),
+            pytest.raises(RuntimeError, match="copy failed"),
+        ):
+            quarantine_holdout(conn, entity_ids, "2023-2025")
+
+        statements = [q for q, _ in conn.cursor_obj.executed]
+        assert statements[-1] == "DROP TABLE IF EXISTS _holdout_stage"
 
 
 class TestGetHoldoutEntityIds:
-    def test_returns_entity_ids(self):
-        conn = MagicMock()
-        with patch(
-            "startuplens.backtest.holdout.execute_query",
-            return_value=[{"entity_id": "e1"}, {"entity_id": "e2"}],
-        ):
-            result = get_holdout_entity_ids(conn, "2023-2025")
+    def test_returns_entity_ids(self, fake_conn, mock_execute_query):
+        mock_execute_query.return_value = [{"entity_id": "e1"}, {"entity_id": "e2"}]
+        result = get_holdout_entity_ids(fake_conn, "2023-2025")
         assert result == ["e1", "e2"]
 
-    def test_empty_result(self):
-        conn = MagicMock()
-        with patch("startuplens.backtest.holdout.execute_query", return_value=[]):
-            result = get_holdout_entity_ids(conn, "2023-2025")
+    def test_empty_result(self, fake_conn, mock_execute_query):
+        result = get_holdout_entity_ids(fake_conn, "2023-2025")
         assert result == []
 
 
 class TestIsEntityHeldOut:
-    def test_returns_true_when_found(self):
-        conn = MagicMock()
-        with patch(
-            "startuplens.backtest.holdout.execute_query",
-            return_value=[{"?column?": 1}],
-        ):
-            assert is_entity_held_out(conn, "e1", "2023-2025") is True
+    def test_returns_true_when_found(self, fake_conn, mock_execute_query):
+        mock_execute_query.return_value = [{"?column?": 1}]
+        assert is_entity_held_out(fake_conn, "e1", "2023-2025") is True
 
-    def test_returns_false_when_not_found(self):
-        conn = MagicMock()
-        with patch("startuplens.backtest.holdout.execute_query", return_value=[]):
-            assert is_entity_held_out(conn, "e1", "2023-2025") is False
+    def test_returns_false_when_not_found(self, fake_conn, mock_execute_query):
+        assert is_entity_held_out(fake_conn, "e1", "2023-2025") is False
 
 
 class TestFilterTrainingEntities:
-    def test_removes_holdout_entities(self):
-        conn = MagicMock()
-        with patch(
-            "startuplens.backtest.holdout.execute_query",
-            return_value=[{"entity_id": "e2"}, {"entity_id": "e4"}],
-        ):
-            result = filter_training_entities(
-                conn, ["e1", "e2", "e3", "e4", "e5"], "2023-2025"
-            )
+    def test_removes_holdout_entities(self, fake_conn, mock_execute_query):
+        mock_execute_query.return_value = [{"entity_id": "e2"}, {"entity_id": "e4"}]
+        result = filter_training_entities(
+            fake_conn, ["e1", "e2", "e3", "e4", "e5"], "2023-2025"
+        )
         assert result == ["e1", "e3", "e5"]
 
-    def test_returns_all_when_no_holdout(self):
-        conn = MagicMock()
-        with patch("startuplens.backtest.holdout.execute_query", return_value=[]):
-            result = filter_training_entities(conn, ["e1", "e2"], "2023-2025")
+    def test_returns_all_when_no_holdout(self, fake_conn, mock_execute_query):
+        result = filter_training_entities(fake_conn, ["e1", "e2"], "2023-2025")
         assert result == ["e1", "e2"]
 
-    def test_empty_input(self):
-        conn = MagicMock()
-        with patch("startuplens.backtest.holdout.execute_query", return_value=[]):
-            result = filter_training_entities(conn, [], "2023-2025")
+    def test_empty_input(self, fake_conn, mock_execute_query):
+        result = filter_training_entities(fake_conn, [], "2023-2025")
         assert result == []
+        mock_execute_query.assert_not_called()
 
 
 class TestGetHoldoutSummary:
-    def test_returns_summary_rows(self):
-        conn = MagicMock()
-        expected = [
+    def test_returns_summary_rows(self, fake_conn, mock_execute_query):
+        mock_execute_query.return_value = [
             {"holdout_window": "2019", "entity_count": 50, "created_at": "2025-01-01"},
             {"holdout_window": "2023-2025", "entity_count": 120, "created_at": "2025-01-01"},
         ]
-        with patch("startuplens.backtest.holdout.execute_query", return_value=expected):
-            result = get_holdout_summary(conn)
+        result = get_holdout_summary(fake_conn)
         assert len(result) == 2
         assert result[0]["holdout_window"] == "2019"
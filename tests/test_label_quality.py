@@ -2,11 +2,14 @@
 
 from datetime import date
 
+import pandas as pd
+
 from startuplens.feature_store.labels import (
     assign_label_tier_academic,
     assign_label_tier_manual,
     assign_label_tier_uk,
     assign_label_tier_us,
+    assign_label_tiers_uk_batch,
     classify_uk_outcome,
     classify_us_outcome,
 )
@@ -46,6 +49,25 @@ class TestUKLabelTier:
         assert assign_label_tier_uk("Dissolved") == 1
         assert assign_label_tier_uk("ACTIVE") == 2
 
+    def test_batch_matches_scalar(self):
+        cases = [
+            ("dissolved", None, False),
+            ("Liquidation", None, None),
+            ("converted-closed", date(2020, 1, 1), True),
+            ("active", date(2025, 6, 1), False),
+            ("ACTIVE", date(2023, 1, 1), True),
+            ("active", None, False),
+            ("open", date(2025, 6, 1), False),
+            (None, date(2025, 6, 1), False),
+        ]
+        statuses, accounts, overdue = (pd.Series(col) for col in zip(*cases))
+        tiers = assign_label_tiers_uk_batch(statuses, accounts, overdue)
+        expected = [
+            assign_label_tier_uk(s, last_accounts_date=d, accounts_overdue=bool(o))
+            for s, d, o in cases
+        ]
+        assert tiers.tolist() == expected == [1, 1, 1, 1, 2, 2, 3, 3]
+
 
 class TestUSLabelTier:
     def test_sec_plus_news_is_tier1(self):
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from types import MappingProxyType
+
 import pytest
 
 from startuplens.backtest.metrics import (
@@ -46,6 +49,14 @@ class TestComputeECE:
         # |accuracy(1.0) - confidence(0.7)| = 0.3, weighted by 1/1
         assert ece == pytest.approx(0.3, abs=0.05)
 
+    def test_out_of_range_predictions_ignored(self):
+        ece = compute_ece([1, 0, 1, 0], [0.9, 0.1, 1.5, 0.4], n_bins=10)
+        assert ece == pytest.approx(0.15)
+
+    def test_nan_predictions_ignored(self):
+        ece = compute_ece([1, 0, 1, 0], [0.9, 0.1, float("nan"), 0.4], n_bins=10)
+        assert ece == pytest.approx(0.15)
+
 
 class TestCalibrationBins:
     """Verify fixed-bin calibration curve generation."""
@@ -72,6 +83,16 @@ class TestCalibrationBins:
         assert bins[0].observed_rate is None
         assert bins[0].abs_error is None
 
+    def test_compute_calibration_bins_skip_nan(self):
+        bins = compute_calibration_bins(
+            y_true=[1, 0, 1, 0],
+            y_pred_proba=[0.9, 0.1, float("nan"), 0.4],
+            n_bins=10,
+        )
+        assert sum(b.sample_size for b in bins) == 3
+        assert bins[-1].sample_size == 1
+        assert bins[-1].mean_pred == pytest.approx(0.9)
+
     def test_compute_calibration_bins_errors(self):
         with pytest.raises(ValueError, match="same length"):
             compute_calibration_bins([1], [0.2, 0.3], n_bins=5)
@@ -84,12 +105,35 @@ class TestCalibrationBins:
 # ------------------------------------------------------------------
 
 
+# (evaluate_backtest kwarg, value, metric name, expected passed, must_pass)
+_BOUNDARY_CASES = [
+    ("survival_auc", 0.64, "Survival AUC", False, True),
+    ("survival_auc", 0.65, "Survival AUC", True, True),
+    ("calibration_ece", 0.08, "Calibration ECE", False, True),
+    ("calibration_ece", 0.079, "Calibration ECE", True, True),
+    ("portfolio_quality_vs_random", 1.3, "Portfolio quality vs random", False, True),
+    ("portfolio_quality_vs_random", 1.31, "Portfolio quality vs random", True, True),
+    ("portfolio_failure_rate_vs_random", 0.7,
+     "Portfolio failure rate vs random", False, True),
+    ("portfolio_failure_rate_vs_random", 0.69,
+     "Portfolio failure rate vs random", True, True),
+    ("claude_text_score_auc", 0.59, "Claude text score AUC", False, True),
+    ("claude_text_score_auc", 0.60, "Claude text score AUC", True, True),
+    ("progress_auc", 0.57, "Progress AUC", False, False),
+    ("model_uncertainty_rate", 0.15, "Model uncertainty rate", True, False),
+    ("model_uncertainty_rate", 0.45, "Model uncertainty rate", False, False),
+    ("model_uncertainty_rate", 0.40, "Model uncertainty rate", True, False),
+    ("top_k_sector_concentration", 0.55, "Top-K sector concentration", False, False),
+    ("top_k_sector_concentration", 0.40, "Top-K sector concentration", True, False),
+]
+
+
 class TestThresholds:
     """Verify that each metric's pass/fail boundary is correct."""
 
-    def _base_kwargs(self, **overrides):
-        """Return a valid set of kwargs that passes all must-pass metrics."""
-        defaults = dict(
+    # A valid set of kwargs that passes every metric.
+    _DEFAULTS = MappingProxyType(
+        dict(
             survival_auc=0.70,
             calibration_ece=0.05,
             portfolio_quality_vs_random=1.5,
@@ -99,96 +143,22 @@ class TestThresholds:
             model_uncertainty_rate=0.20,
             top_k_sector_concentration=0.30,
         )
-        defaults.update(overrides)
-        return defaults
-
-    def test_survival_auc_boundary_fail(self):
-        results = evaluate_backtest(**self._base_kwargs(survival_auc=0.64))
-        survival = next(r for r in results if r.name == "Survival AUC")
-        assert not survival.passed
-        assert survival.must_pass is True
-
-    def test_survival_auc_boundary_pass(self):
-        results = evaluate_backtest(**self._base_kwargs(survival_auc=0.65))
-        survival = next(r for r in results if r.name == "Survival AUC")
-        assert survival.passed
-
-    def test_calibration_ece_boundary_fail(self):
-        results = evaluate_backtest(**self._base_kwargs(calibration_ece=0.08))
-        ece = next(r for r in results if r.name == "Calibration ECE")
-        assert not ece.passed
-        assert ece.must_pass is True
-
-    def test_calibration_ece_boundary_pass(self):
-        results = evaluate_backtest(**self._base_kwargs(calibration_ece=0.079))
-        ece = next(r for r in results if r.name == "Calibration ECE")
-        assert ece.passed
-
-    def test_portfolio_quality_boundary_fail(self):
-        results = evaluate_backtest(**self._base_kwargs(portfolio_quality_vs_random=1.3))
-        moic = next(r for r in results if r.name == "Portfolio quality vs random")
-        assert not moic.passed
-        assert moic.must_pass is True
-
-    def test_portfolio_quality_boundary_pass(self):
-        results = evaluate_backtest(**self._base_kwargs(portfolio_quality_vs_random=1.31))
-        moic = next(r for r in results if r.name == "Portfolio quality vs random")
-        assert moic.passed
-
-    def test_failure_rate_boundary_fail(self):
-        results = evaluate_backtest(**self._base_kwargs(portfolio_failure_rate_vs_random=0.7))
-        fr = next(r for r in results if r.name == "Portfolio failure rate vs random")
-        assert not fr.passed
-        assert fr.must_pass is True
-
-    def test_failure_rate_boundary_pass(self):
-        results = evaluate_backtest(**self._base_kwargs(portfolio_failure_rate_vs_random=0.69))
-        fr = next(r for r in results if r.name == "Portfolio failure rate vs random")
-        assert fr.passed
-
-    def test_claude_text_auc_boundary_fail(self):
-        results = evaluate_backtest(**self._base_kwargs(claude_text_score_auc=0.59))
-        txt = next(r for r in results if r.name == "Claude text score AUC")
-        assert not txt.passed
-        assert txt.must_pass is True
-
-    def test_claude_text_auc_boundary_pass(self):
-        results = evaluate_backtest(**self._base_kwargs(claude_text_score_auc=0.60))
-        txt = next(r for r in results if r.name == "Claude text score AUC")
-        assert txt.passed
-
-    def test_progress_auc_advisory(self):
-        results = evaluate_backtest(**self._base_kwargs(progress_auc=0.57))
-        prog = next(r for r in results if r.name == "Progress AUC")
-        assert not prog.passed
-        assert prog.must_pass is False
-
-    def test_uncertainty_rate_pass(self):
-        results = evaluate_backtest(**self._base_kwargs(model_uncertainty_rate=0.15))
-        ur = next(r for r in results if r.name == "Model uncertainty rate")
-        assert ur.passed
-        assert ur.must_pass is False
-
-    def test_uncertainty_rate_fail(self):
-        results = evaluate_backtest(**self._base_kwargs(model_uncertainty_rate=0.45))
-        ur = next(r for r in results if r.name == "Model uncertainty rate")
-        assert not ur.passed
-
-    def test_uncertainty_rate_boundary(self):
-        results = evaluate_backtest(**self._base_kwargs(model_uncertainty_rate=0.40))
-        ur = next(r for r in results if r.name == "Model uncertainty rate")
-        assert ur.passed
-
-    def test_top_k_sector_concentration_fail(self):
-        results = evaluate_backtest(**self._base_kwargs(top_k_sector_concentration=0.55))
-        sc = next(r for r in results if r.name == "Top-K sector concentration")
-        assert not sc.passed
-        assert sc.must_pass is False
-
-    def test_top_k_sector_concentration_pass(self):
-        results = evaluate_backtest(**self._base_kwargs(top_k_sector_concentration=0.40))
-        sc = next(r for r in results if r.name == "Top-K sector concentration")
-        assert sc.passed
+    )
+
+    def _base_kwargs(self, **overrides):
+        """Return the passing defaults with *overrides* applied."""
+        return {**self._DEFAULTS, **overrides}
+
+    @pytest.mark.parametrize(
+        ("kwarg", "value", "name", "expected_pass", "must_pass"),
+        _BOUNDARY_CASES,
+        ids=[f"{kwarg}={value}" for kwarg, value, *_ in _BOUNDARY_CASES],
+    )
+    def test_boundary(self, kwarg, value, name, expected_pass, must_pass):
+        results = evaluate_backtest(**self._base_kwargs(**{kwarg: value}))
+        result = results[name]
+        assert result.passed is expected_pass
+        assert result.must_pass is must_pass
 
 
 # ------------------------------------------------------------------
@@ -244,3 +214,18 @@ class TestAllMustPassMet:
             top_k_sector_concentration=0.30,
         )
         assert len(results) == 8
+
+    def test_results_index_by_name_and_position(self):
+        results = evaluate_backtest(
+            survival_auc=0.70,
+            calibration_ece=0.05,
+            portfolio_quality_vs_random=1.5,
+            portfolio_failure_rate_vs_random=0.5,
+            claude_text_score_auc=0.65,
+        )
+        assert isinstance(results, Sequence)
+        assert results["Survival AUC"] is results[0]
+        assert not hasattr(results, "append")
+        assert [r.name for r in results][-1] == "Top-K sector concentration"
+        with pytest.raises(KeyError):
+            results["Unknown metric"]
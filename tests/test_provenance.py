@@ -8,6 +8,7 @@ import pytest
 from startuplens.backtest.provenance import (
     compare_runs,
     get_backtest_run,
+    get_backtest_runs_bulk,
     get_latest_runs,
     get_passing_runs,
     log_backtest_run,
@@ -60,6 +61,8 @@ class TestLogBacktestRun:
         params = args[2]
         assert params[0] == "US_Seed"  # model_family
         assert params[1] == 5  # model_version_id
+        assert params[5] == '["a","b"]'  # features_active, compact JSON
+        assert params[7] == '{"auc":0.7}'  # metrics
         assert params[10] is False  # all_passed
         assert params[11] == "test run"  # notes
 
@@ -103,6 +106,19 @@ class TestGetBacktestRun:
         assert result is None
 
 
+class TestGetBacktestRunsBulk:
+    def test_keys_rows_by_id_in_one_query(self):
+        conn = MagicMock()
+        with patch(
+            "startuplens.backtest.provenance.execute_query",
+            return_value=[{"id": 2}, {"id": 1}],
+        ) as mock_eq:
+            result = get_backtest_runs_bulk(conn, (1, 2, 3))
+        assert result == {1: {"id": 1}, 2: {"id": 2}}
+        mock_eq.assert_called_once()
+        assert mock_eq.call_args[0][2] == ([1, 2, 3],)
+
+
 class TestGetLatestRuns:
     def test_returns_runs(self):
         conn = MagicMock()
@@ -166,9 +182,10 @@ class TestCompareRuns:
         conn = MagicMock()
         with patch(
             "startuplens.backtest.provenance.execute_query",
-            side_effect=[[run_a], [run_b]],
-        ):
+            return_value=[run_a, run_b],
+        ) as mock_eq:
             result = compare_runs(conn, 1, 2)
+        mock_eq.assert_called_once()
         assert result["run_a_passed"] is False
         assert result["run_b_passed"] is True
         assert result["metrics"]["auc"]["delta"] == pytest.approx(0.07)
@@ -178,7 +195,7 @@ class TestCompareRuns:
         conn = MagicMock()
         with patch(
             "startuplens.backtest.provenance.execute_query",
-            side_effect=[[], [{"id": 2, "metrics": {}, "all_passed": True}]],
+            return_value=[{"id": 2, "metrics": {}, "all_passed": True}],
         ):
             result = compare_runs(conn, 999, 2)
         assert "error" in result
@@ -189,7 +206,7 @@ class TestCompareRuns:
         conn = MagicMock()
         with patch(
             "startuplens.backtest.provenance.execute_query",
-            side_effect=[[run_a], [run_b]],
+            return_value=[run_a, run_b],
         ):
             result = compare_runs(conn, 1, 2)
         assert result["metrics"]["label"]["delta"] is None
@@ -200,7 +217,7 @@ class TestCompareRuns:
         conn = MagicMock()
         with patch(
             "startuplens.backtest.provenance.execute_query",
-            side_effect=[[run_a], [run_b]],
+            return_value=[run_a, run_b],
         ):
             result = compare_runs(conn, 1, 2)
         assert "auc" in result["metrics"]
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import threading
 import time
+from contextlib import nullcontext
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from startuplens.pipelines.sec_edgar import (
     _classify_instrument_type,
     _classify_round_type,
+    _ingested_quarters,
     _RateLimiter,
     derive_sec_outcomes,
     download_form_c_index,
@@ -19,6 +24,7 @@ from startuplens.pipelines.sec_edgar import (
     parse_form_c_filings,
     run_sec_pipeline,
 )
+from tests._fakes import FakeConn
 
 # Path to test fixtures
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -28,9 +34,9 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
-def sample_index_file(tmp_path: Path) -> Path:
-    """Create a minimal EDGAR-format index file for testing."""
+@pytest.fixture(scope="session")
+def sample_index_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a minimal EDGAR-format index file, written once and shared read-only."""
     # SEC EDGAR index is fixed-width; lines must be wide enough for parsing
     lines = [
         "CIK|Company Name|Form Type|Date Filed|Filename",
@@ -48,23 +54,15 @@ def sample_index_file(tmp_path: Path) -> Path:
         "ZETA FINTECH INC        C       4444444 2023-04-01 "
         "edgar/data/4444444/0001.txt",
     ]
-    idx_file = tmp_path / "company_2023_Q1.idx"
+    idx_file = tmp_path_factory.mktemp("idx") / "company_2023_Q1.idx"
     idx_file.write_text("\n".join(lines) + "\n")
     return idx_file
 
 
 @pytest.fixture()
-def mock_conn() -> MagicMock:
-    """Create a mock database connection."""
-    conn = MagicMock()
-    cursor = MagicMock()
-    conn.cursor.return_value.__enter__ = Mock(return_value=cursor)
-    conn.cursor.return_value.__exit__ = Mock(return_value=False)
-
-    # Make cursor.fetchone() return a dict with an id
-    cursor.fetchone.return_value = {"id": "test-uuid-123"}
-
-    return conn
+def mock_conn() -> FakeConn:
+    """Fake connection whose company upsert returns one (id, source_id) row."""
+    return FakeConn(rows=[{"id": "test-uuid-123", "source_id": "123"}])
 
 
 # ---------------------------------------------------------------------------
@@ -160,6 +158,11 @@ class TestNormalizeFormCRecord:
         result = normalize_form_c_record(raw)
         assert result.get("amount_raised") is None
 
+    def test_handles_unparseable_amount(self):
+        raw = {"total_offering_amount": "$1.2 million"}
+        result = normalize_form_c_record(raw)
+        assert result.get("funding_target") is None
+
     def test_normalizes_sector_to_lowercase(self):
         raw = {"issuer_industry": "Technology"}
         result = normalize_form_c_record(raw)
@@ -230,17 +233,41 @@ class TestRateLimiter:
         # Should have waited at least ~0.1 seconds
         assert elapsed >= 0.1
 
+    def test_burst_allows_back_to_back_calls_then_throttles(self):
+        limiter = _RateLimiter(min_interval=0.1, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait()
+        assert time.monotonic() - start < 0.1
+        limiter.wait()  # fourth call must wait for the 0.3s window to roll
+        assert time.monotonic() - start >= 0.25
+
+    def test_concurrent_callers_are_spaced(self):
+        limiter = _RateLimiter(min_interval=0.05)
+        starts: list[float] = []
+        threads = [
+            threading.Thread(target=lambda: (limiter.wait(), starts.append(time.monotonic())))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.04 for gap in gaps)
+
 
 # ---------------------------------------------------------------------------
 # ingest_form_c_batch tests
 # ---------------------------------------------------------------------------
 
 class TestIngestFormCBatch:
-    def test_returns_zero_for_empty_list(self, mock_conn: MagicMock):
+    def test_returns_zero_for_empty_list(self, mock_conn: FakeConn):
         assert ingest_form_c_batch(mock_conn, []) == 0
-        mock_conn.commit.assert_not_called()
+        assert mock_conn.commits == 0
 
-    def test_inserts_records(self, mock_conn: MagicMock):
+    def test_inserts_records(self, mock_conn: FakeConn):
         records = [
             {
                 "name": "Test Corp",
@@ -256,7 +283,59 @@ class TestIngestFormCBatch:
         ]
         count = ingest_form_c_batch(mock_conn, records)
         assert count == 1
-        mock_conn.commit.assert_called_once()
+        assert mock_conn.commits == 1
+
+    def test_one_statement_per_table_per_page(self, mock_conn: FakeConn):
+        records = [
+            {"name": "A", "source_id": "123", "amount_raised": 1000.0, "form_type": "C"},
+            {"name": "B", "source_id": "456", "amount_raised": 2000.0, "form_type": "C"},
+            {"name": "A2", "source_id": "123", "form_type": "C/A"},
+        ]
+        conn = FakeConn(rows=[
+            {"id": "id-123", "source_id": "123"},
+            {"id": "id-456", "source_id": "456"},
+        ])
+
+        count = ingest_form_c_batch(conn, records)
+
+        assert count == 3
+        cursor = conn.cursor_obj
+        assert len(cursor.executed) == 1
+        company_sql, company_params = cursor.executed[0]
+        assert "INSERT INTO companies" in company_sql
+        # One array per column; duplicate source_id collapses to one row, last wins
+        assert len(company_params) == 6
+        assert company_params[0] == ["A2", "B"]
+        assert company_params[4] == ["123", "456"]
+
+        assert len(cursor.copies) == 1
+        assert "COPY funding_rounds" in cursor.copies[0].statement
+        assert [row[0] for row in cursor.copies[0].rows] == ["id-123", "id-456"]
+
+    def test_pages_records_by_batch_size(self, mock_conn: FakeConn):
+        records = [{"name": f"Co {i}", "source_id": str(i)} for i in range(5)]
+        ingest_form_c_batch(mock_conn, records, batch_size=2)
+
+        executed = mock_conn.cursor_obj.executed
+        assert len(executed) == 3
+        # Same statement text for every page, whatever its size
+        assert len({sql for sql, _ in executed}) == 1
+        assert [len(params[0]) for _, params in executed] == [2, 2, 1]
+        assert mock_conn.commits == 1
+
+    def test_accepts_generator_input(self, mock_conn: FakeConn):
+        records = ({"name": f"Co {i}", "source_id": str(i)} for i in range(5))
+        ingest_form_c_batch(mock_conn, records, batch_size=2)
+
+        assert len(mock_conn.cursor_obj.executed) == 3
+
+    def test_empty_generator_returns_zero(self, mock_conn: FakeConn):
+        assert ingest_form_c_batch(mock_conn, iter([])) == 0
+        assert mock_conn.commits == 0
+
+    def test_rejects_non_positive_batch(self, mock_conn: FakeConn):
+        with pytest.raises(ValueError, match="batch_size"):
+            ingest_form_c_batch(mock_conn, [{"source_id": "1"}], batch_size=0)
 
 
 # ---------------------------------------------------------------------------
@@ -279,28 +358,51 @@ class TestDownloadFormCIndex:
         result = download_form_c_index(2023, 1, tmp_path)
         assert result == existing
 
+    @staticmethod
+    def _streaming_client(chunks: list[bytes], error: Exception | None = None):
+        """Client whose ``stream()`` yields *chunks*, then raises *error* if given."""
+
+        def iter_bytes(chunk_size: int):
+            yield from chunks
+            if error is not None:
+                raise error
+
+        response = SimpleNamespace(raise_for_status=lambda: None, iter_bytes=iter_bytes)
+        return SimpleNamespace(
+            stream=lambda method, url: nullcontext(response), close=lambda: None,
+        )
+
     @patch("startuplens.pipelines.sec_edgar._build_client")
     @patch("startuplens.pipelines.sec_edgar._rate_limiter")
     def test_downloads_and_saves(
         self, mock_limiter: MagicMock, mock_client_fn: MagicMock, tmp_path: Path
     ):
-        mock_response = MagicMock()
-        mock_response.text = "fake index content"
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client_fn.return_value = mock_client
-
-        settings = MagicMock()
-        settings.sec_user_agent = "Test Agent test@example.com"
+        mock_client_fn.return_value = self._streaming_client([b"fake index ", b"content"])
+        settings = SimpleNamespace(sec_user_agent="Test Agent test@example.com")
 
         result = download_form_c_index(2023, 1, tmp_path, settings=settings)
 
         assert result.exists()
         assert result.read_text() == "fake index content"
+        assert list(tmp_path.iterdir()) == [result]
         mock_limiter.wait.assert_called_once()
 
+    @patch("startuplens.pipelines.sec_edgar._build_client")
+    @patch("startuplens.pipelines.sec_edgar._rate_limiter")
+    def test_interrupted_download_leaves_no_file(
+        self, mock_limiter: MagicMock, mock_client_fn: MagicMock, tmp_path: Path
+    ):
+        mock_client_fn.return_value = self._streaming_client(
+            [b"partial"], error=httpx.ReadError("connection reset"),
+        )
+        settings = SimpleNamespace(sec_user_agent="Test Agent test@example.com")
+
+        with pytest.raises(httpx.ReadError):
+            download_form_c_index(2023, 1, tmp_path, settings=settings)
+
+        # A truncated index must not be mistaken for a finished download later
+        assert list(tmp_path.iterdir()) == []
+
 
 # ---------------------------------------------------------------------------
 # run_sec_pipeline tests (mocked)
@@ -308,9 +410,12 @@ class TestDownloadFormCIndex:
 
 class TestRunSecPipeline:
     @patch("startuplens.pipelines.sec_edgar.ingest_form_c_batch", return_value=5)
-    @patch("startuplens.pipelines.sec_edgar.parse_form_c_filings", return_value=[{"cik": "1"}])
+    @patch(
+        "startuplens.pipelines.sec_edgar.parse_form_c_filings_iter",
+        return_value=[{"cik": "1"}],
+    )
     @patch("startuplens.pipelines.sec_edgar.download_form_c_index")
-    @patch("startuplens.pipelines.sec_edgar._is_quarter_ingested", return_value=False)
+    @patch("startuplens.pipelines.sec_edgar._ingested_quarters", return_value=set())
     def test_processes_all_quarters(
         self,
         mock_ingested: MagicMock,
@@ -320,26 +425,89 @@ class TestRunSecPipeline:
         tmp_path: Path,
     ):
         mock_download.return_value = tmp_path / "test.idx"
-        conn = MagicMock()
-        settings = MagicMock()
-
-        summary = run_sec_pipeline(conn, settings, [2023], output_dir=tmp_path)
+        summary = run_sec_pipeline(FakeConn(), SimpleNamespace(), [2023], output_dir=tmp_path)
 
         assert summary["quarters_processed"] == 4
         assert summary["records_ingested"] == 20  # 5 per quarter x 4 quarters
 
-    @patch("startuplens.pipelines.sec_edgar._is_quarter_ingested", return_value=True)
-    def test_skips_ingested_quarters(self, mock_ingested: MagicMock, tmp_path: Path):
-        conn = MagicMock()
-        settings = MagicMock()
+    @patch("startuplens.pipelines.sec_edgar.download_form_c_index")
+    @patch("startuplens.pipelines.sec_edgar._ingested_quarters", return_value=set())
+    def test_streams_parsed_records_into_ingest(
+        self,
+        mock_ingested: MagicMock,
+        mock_download: MagicMock,
+        sample_index_file: Path,
+        tmp_path: Path,
+    ):
+        mock_download.return_value = sample_index_file
+        seen: list[dict] = []
+
+        def consume(conn, records):
+            seen.extend(records)
+            return len(seen)
+
+        with patch("startuplens.pipelines.sec_edgar.ingest_form_c_batch", side_effect=consume):
+            summary = run_sec_pipeline(
+                FakeConn(), SimpleNamespace(), [2023], output_dir=tmp_path,
+            )
+
+        # 5 Form C rows in the fixture, re-read for each of the 4 quarters
+        assert summary["filings_parsed"] == 20
+        assert seen[0]["source_id"] == "1234567_q2023Q1"
+        assert seen[-1]["source_id"] == "4444444_q2023Q4"
+
+    @patch("startuplens.pipelines.sec_edgar.ingest_form_c_batch", return_value=5)
+    @patch("startuplens.pipelines.sec_edgar.parse_form_c_filings_iter", return_value=[])
+    @patch("startuplens.pipelines.sec_edgar._ingested_quarters", return_value=set())
+    def test_failed_download_does_not_stop_other_quarters(
+        self,
+        mock_ingested: MagicMock,
+        mock_parse: MagicMock,
+        mock_ingest: MagicMock,
+        tmp_path: Path,
+    ):
+        def download(year, quarter, output_dir, *, settings):
+            if quarter == 2:
+                msg = "connection reset"
+                raise OSError(msg)
+            return tmp_path / f"company_{year}_Q{quarter}.idx"
+
+        with patch(
+            "startuplens.pipelines.sec_edgar.download_form_c_index", side_effect=download,
+        ):
+            summary = run_sec_pipeline(
+                FakeConn(), SimpleNamespace(), [2023], output_dir=tmp_path,
+            )
+
+        assert summary["quarters_processed"] == 3
+        assert summary["errors"] == ["2023-Q2: connection reset"]
+        # Ingest still runs in quarter order on the calling thread
+        parsed_paths = [c.args[0].name for c in mock_parse.call_args_list]
+        assert parsed_paths == [
+            "company_2023_Q1.idx", "company_2023_Q3.idx", "company_2023_Q4.idx",
+        ]
 
-        summary = run_sec_pipeline(conn, settings, [2023], output_dir=tmp_path)
+    @patch(
+        "startuplens.pipelines.sec_edgar._ingested_quarters",
+        return_value={(2023, 1), (2023, 2), (2023, 3), (2023, 4)},
+    )
+    def test_skips_ingested_quarters(self, mock_ingested: MagicMock, tmp_path: Path):
+        summary = run_sec_pipeline(FakeConn(), SimpleNamespace(), [2023], output_dir=tmp_path)
 
         assert summary["quarters_skipped"] == 4
         assert summary["quarters_processed"] == 0
         assert summary["records_ingested"] == 0
 
 
+class TestIngestedQuarters:
+    @patch("startuplens.db.execute_query")
+    def test_ingested_quarters_parsed_from_source_id_tags(self, mock_eq: MagicMock):
+        mock_eq.return_value = [{"tag": "2023Q1"}, {"tag": None}, {"tag": "2021Q4"}]
+
+        assert _ingested_quarters(FakeConn()) == {(2023, 1), (2021, 4)}
+        mock_eq.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # derive_sec_outcomes tests
 # ---------------------------------------------------------------------------
@@ -348,28 +516,27 @@ class TestRunSecPipeline:
 class TestDeriveSecOutcomes:
     @patch("startuplens.db.execute_query")
     def test_returns_count_of_inserted_rows(self, mock_eq: MagicMock):
-        conn = MagicMock()
-        # INSERT...RETURNING returns one dict per inserted row
-        mock_eq.return_value = [
-            {"company_id": 1}, {"company_id": 2}, {"company_id": 3},
-        ]
+        conn = FakeConn()
+        # The insert CTE is counted server-side: a single row comes back
+        mock_eq.return_value = [{"cnt": 3}]
 
         result = derive_sec_outcomes(conn)
         assert result == 3
-        conn.commit.assert_called_once()
+        assert conn.commits == 1
 
     @patch("startuplens.db.execute_query")
     def test_returns_zero_when_no_matches(self, mock_eq: MagicMock):
-        conn = MagicMock()
-        mock_eq.return_value = []
+        conn = FakeConn()
+        mock_eq.return_value = [{"cnt": 0}]
 
         result = derive_sec_outcomes(conn)
         assert result == 0
+        mock_eq.assert_called_once()
 
     @patch("startuplens.db.execute_query")
     def test_insert_query_contains_cross_reference(self, mock_eq: MagicMock):
-        conn = MagicMock()
-        mock_eq.return_value = [{"company_id": 5}]
+        conn = FakeConn()
+        mock_eq.return_value = [{"cnt": 1}]
 
         derive_sec_outcomes(conn)
 
@@ -378,11 +545,12 @@ class TestDeriveSecOutcomes:
         assert "form_d_ciks" in insert_sql
         assert "INSERT INTO crowdfunding_outcomes" in insert_sql
         assert "sec_cross_reference" in insert_sql
-        assert "RETURNING company_id" in insert_sql
+        assert "RETURNING 1" in insert_sql
+        assert "SELECT COUNT(*) AS cnt FROM inserted" in insert_sql
 
     @patch("startuplens.db.execute_query")
     def test_derives_campaign_date_from_source_id(self, mock_eq: MagicMock):
-        conn = MagicMock()
+        conn = FakeConn()
         mock_eq.return_value = []
 
         derive_sec_outcomes(conn)
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import io
 import zipfile
+from contextlib import nullcontext
 from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from startuplens.pipelines.sec_form_d import (
@@ -18,20 +22,35 @@ from startuplens.pipelines.sec_form_d import (
     parse_form_d_dataset,
     run_form_d_pipeline,
 )
+from tests._fakes import FakeConn
 
 # Path to test fixtures
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "form_d_sample"
 
+# Opaque stand-ins shared by tests that only pass them through
+_SETTINGS = SimpleNamespace(sec_user_agent="Test Agent test@example.com")
+_DUMMY_CONN = SimpleNamespace(close=lambda: None)
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def sample_zip(tmp_path: Path) -> Path:
-    """Create a ZIP file from the fixture TSV files."""
-    zip_path = tmp_path / "form_d_2023_Q1.zip"
+def _zip_in_memory(members: dict[str, str | bytes]) -> io.BytesIO:
+    """Build a ZIP archive in memory, for code that takes an open ZipFile."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+@pytest.fixture(scope="session")
+def sample_zip(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a ZIP file from the fixture TSV files, built once and shared read-only."""
+    zip_path = tmp_path_factory.mktemp("form_d") / "form_d_2023_Q1.zip"
     with zipfile.ZipFile(zip_path, "w") as zf:
         for tsv_name in ("FORMDSUBMISSION.tsv", "ISSUERS.tsv", "OFFERING.tsv"):
             fixture_path = FIXTURES_DIR / tsv_name
@@ -40,16 +59,9 @@ def sample_zip(tmp_path: Path) -> Path:
 
 
 @pytest.fixture()
-def mock_conn() -> MagicMock:
-    """Create a mock database connection."""
-    conn = MagicMock()
-    cursor = MagicMock()
-    conn.cursor.return_value.__enter__ = Mock(return_value=cursor)
-    conn.cursor.return_value.__exit__ = Mock(return_value=False)
-    cursor.fetchone.return_value = {"id": "test-uuid-123"}
-    # For bulk inserts: fetchall returns list of {id, source_id} dicts
-    cursor.fetchall.return_value = [{"id": "test-uuid-123", "source_id": "123_q2023Q1"}]
-    return conn
+def mock_conn() -> FakeConn:
+    """Fake connection whose bulk upsert returns one {id, source_id} row."""
+    return FakeConn(rows=[{"id": "test-uuid-123", "source_id": "123_q2023Q1"}])
 
 
 # ---------------------------------------------------------------------------
@@ -75,13 +87,10 @@ class TestReadTsvFromZip:
             rows = _read_tsv_from_zip(zf, "NONEXISTENT.tsv")
         assert rows == []
 
-    def test_handles_latin1_encoding(self, tmp_path: Path):
+    def test_handles_latin1_encoding(self):
         """TSV with Latin-1 characters should be decoded without error."""
-        zip_path = tmp_path / "latin1.zip"
         content = "NAME\tVALUE\nCaf\xe9 Corp\t100\n".encode("latin-1")
-        with zipfile.ZipFile(zip_path, "w") as zf:
-            zf.writestr("TEST.tsv", content)
-        with zipfile.ZipFile(zip_path) as zf:
+        with zipfile.ZipFile(_zip_in_memory({"TEST.tsv": content})) as zf:
             rows = _read_tsv_from_zip(zf, "TEST.tsv")
         assert len(rows) == 1
         assert "Caf" in rows[0]["NAME"]
@@ -92,21 +101,24 @@ class TestReadTsvFromZip:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def parsed_records(sample_zip: Path) -> list[dict]:
+    """The sample zip parsed once; tests only read the records."""
+    return parse_form_d_dataset(sample_zip)
+
+
 class TestParseFormDDataset:
-    def test_parses_all_issuers(self, sample_zip: Path):
-        records = parse_form_d_dataset(sample_zip)
-        assert len(records) == 3
+    def test_parses_all_issuers(self, parsed_records: list[dict]):
+        assert len(parsed_records) == 3
 
-    def test_joins_issuers_and_offerings(self, sample_zip: Path):
-        records = parse_form_d_dataset(sample_zip)
-        for rec in records:
+    def test_joins_issuers_and_offerings(self, parsed_records: list[dict]):
+        for rec in parsed_records:
             assert "ENTITYNAME" in rec
             # All 3 fixture records have matching offerings
             assert "TOTALAMOUNTSOLD" in rec
 
-    def test_joins_submission_fields(self, sample_zip: Path):
-        records = parse_form_d_dataset(sample_zip)
-        for rec in records:
+    def test_joins_submission_fields(self, parsed_records: list[dict]):
+        for rec in parsed_records:
             assert "FILING_DATE" in rec
 
     def test_handles_missing_offering(self, tmp_path: Path):
@@ -144,98 +156,55 @@ class TestParseFormDDataset:
 # ---------------------------------------------------------------------------
 
 
+# (raw Form D record, normalized key, expected value)
+_NORMALIZE_CASES = [
+    pytest.param({"ENTITYNAME": "ACME INC"}, "name", "ACME INC", id="maps_name"),
+    pytest.param({"CIK": "0001234567"}, "source_id", "1234567", id="maps_cik"),
+    pytest.param({"CIK": "0000001234"}, "source_id", "1234", id="strips_cik_zeros"),
+    pytest.param({"CIK": "0000000000"}, "source_id", "0", id="all_zero_cik"),
+    pytest.param({}, "country", "US", id="default_country"),
+    pytest.param({}, "source", "sec_form_d", id="default_source"),
+    pytest.param({}, "name", "Unknown", id="default_name"),
+    pytest.param(
+        {"TOTALAMOUNTSOLD": "1,500,000"}, "amount_raised", 1_500_000.0, id="amount_commas",
+    ),
+    pytest.param(
+        {"TOTALAMOUNTSOLD": "$2,500,000"}, "amount_raised", 2_500_000.0, id="amount_dollar",
+    ),
+    pytest.param(
+        {"TOTALOFFERINGAMOUNT": "Indefinite"}, "funding_target", None, id="amount_indefinite",
+    ),
+    pytest.param(
+        {"YEAROFINC_VALUE_ENTERED": "2020"}, "founding_date", date(2020, 1, 1),
+        id="founding_year",
+    ),
+    pytest.param({}, "founding_date", None, id="founding_missing"),
+    pytest.param(
+        {"YEAROFINC_VALUE_ENTERED": "NotAYear"}, "founding_date", None, id="founding_invalid",
+    ),
+    pytest.param({"INDUSTRYGROUPTYPE": "Technology"}, "sector", "technology", id="sector_lower"),
+    pytest.param({"INDUSTRYGROUPTYPE": "  "}, "sector", None, id="sector_blank"),
+    pytest.param(
+        {"FEDERALEXEMPTIONS_ITEMS_LIST": "06b,06c"}, "federal_exemptions", "06b,06c",
+        id="federal_exemptions",
+    ),
+    pytest.param({"FILING_DATE": "15-JAN-2023"}, "filing_date", "2023-01-15", id="date_dd_mon"),
+    pytest.param({"FILING_DATE": "29-MAR-2024"}, "filing_date", "2024-03-29", id="date_leap"),
+    pytest.param({"FILING_DATE": "2024-03-29"}, "filing_date", "2024-03-29", id="date_iso"),
+]
+
+
 class TestNormalizeFormDRecord:
-    def test_maps_field_names(self):
-        raw = {
-            "ENTITYNAME": "ACME INC",
-            "CIK": "0001234567",
-            "FILING_DATE": "15-JAN-2023",
-        }
-        result = normalize_form_d_record(raw)
-        assert result["name"] == "ACME INC"
-        assert result["source_id"] == "1234567"
-        assert result["filing_date"] == "2023-01-15"
-
-    def test_strips_leading_zeros_from_cik(self):
-        raw = {"CIK": "0000001234"}
-        result = normalize_form_d_record(raw)
-        assert result["source_id"] == "1234"
-
-    def test_all_zero_cik_becomes_zero(self):
-        raw = {"CIK": "0000000000"}
-        result = normalize_form_d_record(raw)
-        assert result["source_id"] == "0"
-
-    def test_defaults_country_to_us(self):
-        result = normalize_form_d_record({})
-        assert result["country"] == "US"
-
-    def test_defaults_source_to_sec_form_d(self):
-        result = normalize_form_d_record({})
-        assert result["source"] == "sec_form_d"
-
-    def test_coerces_numeric_amount_raised(self):
-        raw = {"TOTALAMOUNTSOLD": "1,500,000"}
-        result = normalize_form_d_record(raw)
-        assert result["amount_raised"] == 1_500_000.0
-
-    def test_handles_empty_numeric_string(self):
-        raw = {"TOTALAMOUNTSOLD": ""}
-        result = normalize_form_d_record(raw)
-        assert result.get("amount_raised") is None
-
-    def test_handles_indefinite_offering_amount(self):
-        raw = {"TOTALOFFERINGAMOUNT": "Indefinite"}
-        result = normalize_form_d_record(raw)
-        assert result["funding_target"] is None
-
-    def test_derives_founding_date_from_year(self):
-        raw = {"YEAROFINC_VALUE_ENTERED": "2020"}
-        result = normalize_form_d_record(raw)
-        assert result["founding_date"] == date(2020, 1, 1)
-
-    def test_missing_year_gives_none_founding_date(self):
-        result = normalize_form_d_record({})
-        assert result["founding_date"] is None
-
-    def test_invalid_year_gives_none_founding_date(self):
-        raw = {"YEAROFINC_VALUE_ENTERED": "NotAYear"}
-        result = normalize_form_d_record(raw)
-        assert result["founding_date"] is None
-
-    def test_normalizes_sector_to_lowercase(self):
-        raw = {"INDUSTRYGROUPTYPE": "Technology"}
-        result = normalize_form_d_record(raw)
-        assert result["sector"] == "technology"
-
-    def test_empty_sector_becomes_none(self):
-        raw = {"INDUSTRYGROUPTYPE": "  "}
-        result = normalize_form_d_record(raw)
-        assert result["sector"] is None
-
-    def test_preserves_federal_exemptions(self):
-        raw = {"FEDERALEXEMPTIONS_ITEMS_LIST": "06b,06c"}
-        result = normalize_form_d_record(raw)
-        assert result["federal_exemptions"] == "06b,06c"
-
-    def test_missing_name_defaults_to_unknown(self):
-        result = normalize_form_d_record({})
-        assert result["name"] == "Unknown"
-
-    def test_dollar_sign_in_amount(self):
-        raw = {"TOTALAMOUNTSOLD": "$2,500,000"}
-        result = normalize_form_d_record(raw)
-        assert result["amount_raised"] == 2_500_000.0
-
-    def test_dd_mon_yyyy_date_format(self):
-        raw = {"FILING_DATE": "29-MAR-2024"}
-        result = normalize_form_d_record(raw)
-        assert result["filing_date"] == "2024-03-29"
-
-    def test_iso_date_format_preserved(self):
-        raw = {"FILING_DATE": "2024-03-29"}
-        result = normalize_form_d_record(raw)
-        assert result["filing_date"] == "2024-03-29"
+    @pytest.mark.parametrize(("raw", "key", "expected"), _NORMALIZE_CASES)
+    def test_normalize(self, raw, key, expected):
+        value = normalize_form_d_record(raw)[key]
+        if expected is None:
+            assert value is None
+        else:
+            assert value == expected
+
+    def test_empty_amount_omitted(self):
+        assert "amount_raised" not in normalize_form_d_record({"TOTALAMOUNTSOLD": ""})
 
 
 # ---------------------------------------------------------------------------
@@ -243,33 +212,31 @@ class TestNormalizeFormDRecord:
 # ---------------------------------------------------------------------------
 
 
-class TestClassifyRoundTypeD:
-    def test_506b(self):
-        assert _classify_round_type_d("06b") == "rule_506b"
-
-    def test_506c(self):
-        assert _classify_round_type_d("06c") == "rule_506c"
-
-    def test_504(self):
-        assert _classify_round_type_d("04") == "rule_504"
-
-    def test_multiple_exemptions_prefers_506c(self):
-        assert _classify_round_type_d("06b,06c") == "rule_506c"
-
-    def test_none_defaults_to_reg_d(self):
-        assert _classify_round_type_d(None) == "reg_d"
+# (federal exemptions list, expected round type)
+_ROUND_TYPE_CASES = [
+    ("06b", "rule_506b"),
+    ("06c", "rule_506c"),
+    ("04", "rule_504"),
+    ("06b,06c", "rule_506c"),  # multiple exemptions prefer 506(c)
+    ("06", "rule_506"),
+    ("4(a)(5)", "section_4a5"),
+    (None, "reg_d"),
+    ("", "reg_d"),
+    ("xyz", "reg_d"),
+]
 
-    def test_empty_string_defaults_to_reg_d(self):
-        assert _classify_round_type_d("") == "reg_d"
 
-    def test_unknown_exemption_defaults_to_reg_d(self):
-        assert _classify_round_type_d("xyz") == "reg_d"
-
-    def test_generic_506(self):
-        assert _classify_round_type_d("06") == "rule_506"
-
-    def test_section_4a5(self):
-        assert _classify_round_type_d("4(a)(5)") == "section_4a5"
+class TestClassifyRoundTypeD:
+    @pytest.mark.parametrize(
+        ("exemptions", "expected"),
+        _ROUND_TYPE_CASES,
+        ids=[
+            "none" if exemptions is None else exemptions or "empty"
+            for exemptions, _ in _ROUND_TYPE_CASES
+        ],
+    )
+    def test_classify(self, exemptions, expected):
+        assert _classify_round_type_d(exemptions) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -301,20 +268,14 @@ class TestDownloadFormDDataset:
     def test_downloads_and_saves(
         self, mock_limiter: MagicMock, mock_client_fn: MagicMock, tmp_path: Path,
     ):
-        # Create a mock streaming response
-        mock_response = MagicMock()
-        mock_response.iter_bytes.return_value = [b"fake zip content"]
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = MagicMock()
-        mock_client.stream.return_value.__enter__ = Mock(return_value=mock_response)
-        mock_client.stream.return_value.__exit__ = Mock(return_value=False)
-        mock_client_fn.return_value = mock_client
-
-        settings = MagicMock()
-        settings.sec_user_agent = "Test Agent test@example.com"
+        response = SimpleNamespace(
+            raise_for_status=lambda: None, iter_bytes=lambda: iter([b"fake zip content"]),
+        )
+        mock_client_fn.return_value = SimpleNamespace(
+            stream=lambda method, url: nullcontext(response), close=lambda: None,
+        )
 
-        result = download_form_d_dataset(2023, 1, tmp_path, settings=settings)
+        result = download_form_d_dataset(2023, 1, tmp_path, settings=_SETTINGS)
 
         assert result.exists()
         assert result.read_bytes() == b"fake zip content"
@@ -327,11 +288,11 @@ class TestDownloadFormDDataset:
 
 
 class TestIngestFormDBatch:
-    def test_returns_zero_for_empty_list(self, mock_conn: MagicMock):
+    def test_returns_zero_for_empty_list(self, mock_conn: FakeConn):
         assert ingest_form_d_batch(mock_conn, []) == 0
-        mock_conn.commit.assert_not_called()
+        assert mock_conn.commits == 0
 
-    def test_inserts_records(self, mock_conn: MagicMock):
+    def test_inserts_records(self, mock_conn: FakeConn):
         records = [
             {
                 "name": "Test Corp",
@@ -347,9 +308,11 @@ class TestIngestFormDBatch:
         ]
         count = ingest_form_d_batch(mock_conn, records)
         assert count == 1
-        mock_conn.commit.assert_called()
+        assert mock_conn.commits == 1
+        # Company upsert, then the funding round insert
+        assert len(mock_conn.cursor_obj.executed) == 2
 
-    def test_skips_funding_round_when_no_amount(self, mock_conn: MagicMock):
+    def test_skips_funding_round_when_no_amount(self, mock_conn: FakeConn):
         records = [
             {
                 "name": "No Money Corp",
@@ -361,8 +324,7 @@ class TestIngestFormDBatch:
         count = ingest_form_d_batch(mock_conn, records)
         assert count == 1
         # Only one execute call (company insert), not two (no funding round)
-        cursor = mock_conn.cursor.return_value.__enter__.return_value
-        assert cursor.execute.call_count == 1
+        assert len(mock_conn.cursor_obj.executed) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -370,8 +332,9 @@ class TestIngestFormDBatch:
 # ---------------------------------------------------------------------------
 
 
+# Every quarter worker opens its own connection; hand them all the same stand-in
+@patch("startuplens.db.get_connection", new=lambda settings: _DUMMY_CONN)
 class TestRunFormDPipeline:
-    @patch("startuplens.db.get_connection")
     @patch("startuplens.pipelines.sec_form_d.ingest_form_d_batch", return_value=100)
     @patch(
         "startuplens.pipelines.sec_form_d.parse_form_d_dataset",
@@ -385,54 +348,35 @@ class TestRunFormDPipeline:
         mock_download: MagicMock,
         mock_parse: MagicMock,
         mock_ingest: MagicMock,
-        mock_get_conn: MagicMock,
         tmp_path: Path,
     ):
         mock_download.return_value = tmp_path / "test.zip"
-        mock_get_conn.return_value = MagicMock()
-        settings = MagicMock()
-
-        summary = run_form_d_pipeline(MagicMock(), settings, [2023], output_dir=tmp_path)
+        summary = run_form_d_pipeline(_DUMMY_CONN, _SETTINGS, [2023], output_dir=tmp_path)
 
         assert summary["quarters_processed"] == 4
         assert summary["records_ingested"] == 400  # 100 per quarter x 4
 
-    @patch("startuplens.db.get_connection")
     @patch("startuplens.pipelines.sec_form_d._is_quarter_ingested_d", return_value=True)
-    def test_skips_ingested_quarters(
-        self, mock_ingested: MagicMock, mock_get_conn: MagicMock, tmp_path: Path,
-    ):
-        mock_get_conn.return_value = MagicMock()
-        settings = MagicMock()
-
-        summary = run_form_d_pipeline(MagicMock(), settings, [2023], output_dir=tmp_path)
+    def test_skips_ingested_quarters(self, mock_ingested: MagicMock, tmp_path: Path):
+        summary = run_form_d_pipeline(_DUMMY_CONN, _SETTINGS, [2023], output_dir=tmp_path)
 
         assert summary["quarters_skipped"] == 4
         assert summary["quarters_processed"] == 0
 
-    @patch("startuplens.db.get_connection")
     @patch("startuplens.pipelines.sec_form_d.download_form_d_dataset")
     @patch("startuplens.pipelines.sec_form_d._is_quarter_ingested_d", return_value=False)
     def test_handles_http_errors(
         self,
         mock_ingested: MagicMock,
         mock_download: MagicMock,
-        mock_get_conn: MagicMock,
         tmp_path: Path,
     ):
+        request = httpx.Request("GET", "https://www.sec.gov/form_d.zip")
         mock_download.side_effect = httpx.HTTPStatusError(
-            "Not Found",
-            request=MagicMock(),
-            response=MagicMock(status_code=404),
+            "Not Found", request=request, response=httpx.Response(404, request=request),
         )
-        mock_get_conn.return_value = MagicMock()
-        settings = MagicMock()
-
-        summary = run_form_d_pipeline(MagicMock(), settings, [2023], output_dir=tmp_path)
+        summary = run_form_d_pipeline(_DUMMY_CONN, _SETTINGS, [2023], output_dir=tmp_path)
 
         assert summary["quarters_processed"] == 0
         assert len(summary["errors"]) == 4
-
-
-# Need httpx for the error test
-import httpx  # noqa: E402
+        assert all(err.endswith("HTTP 404") for err in summary["errors"])
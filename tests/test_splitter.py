@@ -5,12 +5,34 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 
+import numpy as np
+import pytest
+
 from startuplens.backtest.splitter import (
     TimeWindow,
     generate_walk_forward_windows,
     split_entities_by_window,
 )
 
+# Windows are frozen dataclasses, so one tuple built at import is shared by
+# every test that only reads them.
+_WINDOWS = tuple(generate_walk_forward_windows())
+
+# The spec's windows, spelled out independently of the module's own table
+_EXPECTED_WINDOWS = [
+    TimeWindow(date(2016, 1, 1), date(2018, 12, 31), date(2019, 1, 1), date(2019, 12, 31),
+               "Train 2016-2018, Test 2019"),
+    TimeWindow(date(2016, 1, 1), date(2019, 12, 31), date(2020, 1, 1), date(2020, 12, 31),
+               "Train 2016-2019, Test 2020"),
+    TimeWindow(date(2016, 1, 1), date(2020, 12, 31), date(2021, 1, 1), date(2021, 12, 31),
+               "Train 2016-2020, Test 2021"),
+    TimeWindow(date(2016, 1, 1), date(2021, 12, 31), date(2022, 1, 1), date(2022, 12, 31),
+               "Train 2016-2021, Test 2022"),
+    # Final holdout: three test years
+    TimeWindow(date(2016, 1, 1), date(2022, 12, 31), date(2023, 1, 1), date(2025, 12, 31),
+               "Train 2016-2022, Test 2023-2025"),
+]
+
 # ------------------------------------------------------------------
 # Window generation
 # ------------------------------------------------------------------
@@ -24,56 +46,33 @@ class TestGenerateWalkForwardWindows:
         assert len(windows) == 5
 
     def test_all_are_time_window_instances(self):
-        windows = generate_walk_forward_windows()
-        for w in windows:
+        for w in _WINDOWS:
             assert isinstance(w, TimeWindow)
 
-    def test_window_0_boundaries(self):
-        w = generate_walk_forward_windows()[0]
-        assert w.train_start == date(2016, 1, 1)
-        assert w.train_end == date(2018, 12, 31)
-        assert w.test_start == date(2019, 1, 1)
-        assert w.test_end == date(2019, 12, 31)
-        assert w.label == "Train 2016-2018, Test 2019"
-
-    def test_window_1_boundaries(self):
-        w = generate_walk_forward_windows()[1]
-        assert w.train_start == date(2016, 1, 1)
-        assert w.train_end == date(2019, 12, 31)
-        assert w.test_start == date(2020, 1, 1)
-        assert w.test_end == date(2020, 12, 31)
-
-    def test_window_2_boundaries(self):
-        w = generate_walk_forward_windows()[2]
-        assert w.train_end == date(2020, 12, 31)
-        assert w.test_start == date(2021, 1, 1)
-        assert w.test_end == date(2021, 12, 31)
-
-    def test_window_3_boundaries(self):
-        w = generate_walk_forward_windows()[3]
-        assert w.train_end == date(2021, 12, 31)
-        assert w.test_start == date(2022, 1, 1)
-        assert w.test_end == date(2022, 12, 31)
-
-    def test_window_4_final_holdout(self):
-        w = generate_walk_forward_windows()[4]
-        assert w.train_end == date(2022, 12, 31)
-        assert w.test_start == date(2023, 1, 1)
-        assert w.test_end == date(2025, 12, 31)
-        assert w.label == "Train 2016-2022, Test 2023-2025"
+    @pytest.mark.parametrize(
+        ("idx", "expected"),
+        list(enumerate(_EXPECTED_WINDOWS)),
+        ids=[f"window_{i}" for i in range(len(_EXPECTED_WINDOWS))],
+    )
+    def test_window_boundaries(self, idx, expected):
+        assert _WINDOWS[idx] == expected
+
+    def test_window_structure(self):
+        """Whole-sequence check: no extra, missing or reordered windows."""
+        assert _WINDOWS == tuple(_EXPECTED_WINDOWS)
 
+    # Spec invariants, checked on the generated windows rather than the table
     def test_train_always_starts_2016(self):
-        for w in generate_walk_forward_windows():
+        for w in _WINDOWS:
             assert w.train_start == date(2016, 1, 1)
 
     def test_train_end_always_before_test_start(self):
-        for w in generate_walk_forward_windows():
+        for w in _WINDOWS:
             assert w.train_end < w.test_start
 
     def test_windows_are_expanding(self):
-        windows = generate_walk_forward_windows()
-        for i in range(1, len(windows)):
-            assert windows[i].train_end > windows[i - 1].train_end
+        for earlier, later in zip(_WINDOWS, _WINDOWS[1:]):
+            assert later.train_end > earlier.train_end
 
 
 # ------------------------------------------------------------------
@@ -81,17 +80,22 @@ class TestGenerateWalkForwardWindows:
 # ------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _FakeEntity:
     campaign_date: str
     name: str = ""
 
 
+@pytest.fixture(scope="module")
+def window() -> TimeWindow:
+    """The first window: train 2016-2018, test 2019."""
+    return _WINDOWS[0]
+
+
 class TestSplitEntitiesByWindow:
     """Verify entity partitioning logic."""
 
-    def test_entities_in_train_range(self):
-        window = generate_walk_forward_windows()[0]  # train 2016-2018, test 2019
+    def test_entities_in_train_range(self, window):
         entities = [
             _FakeEntity(campaign_date="2017-06-01", name="A"),
             _FakeEntity(campaign_date="2019-03-15", name="B"),
@@ -102,8 +106,7 @@ class TestSplitEntitiesByWindow:
         assert len(test) == 1
         assert test[0].name == "B"
 
-    def test_boundary_dates_inclusive(self):
-        window = generate_walk_forward_windows()[0]
+    def test_boundary_dates_inclusive(self, window):
         entities = [
             _FakeEntity(campaign_date="2016-01-01", name="start_train"),
             _FakeEntity(campaign_date="2018-12-31", name="end_train"),
@@ -114,8 +117,7 @@ class TestSplitEntitiesByWindow:
         assert len(train) == 2
         assert len(test) == 2
 
-    def test_entity_outside_both_ranges_excluded(self):
-        window = generate_walk_forward_windows()[0]  # train 2016-2018, test 2019
+    def test_entity_outside_both_ranges_excluded(self, window):
         entities = [
             _FakeEntity(campaign_date="2015-12-31", name="too_early"),
             _FakeEntity(campaign_date="2020-01-01", name="too_late"),
@@ -124,26 +126,31 @@ class TestSplitEntitiesByWindow:
         assert len(train) == 0
         assert len(test) == 0
 
-    def test_accepts_date_objects(self):
-        window = generate_walk_forward_windows()[0]
+    def test_accepts_date_objects(self, window):
         entities = [_FakeEntity(campaign_date=date(2017, 5, 10).isoformat())]
         train, test = split_entities_by_window(entities, window)
         assert len(train) == 1
 
-    def test_empty_input(self):
-        window = generate_walk_forward_windows()[0]
+    def test_empty_input(self, window):
         train, test = split_entities_by_window([], window)
         assert train == []
         assert test == []
 
-    def test_split_with_sample_deals(self, sample_deals):
+    def test_split_with_sample_deals(self, window, sample_deals):
         """Use the shared fixture to verify splitting works with ScoredDeal objects."""
-        window = generate_walk_forward_windows()[0]  # train 2016-2018, test 2019
         train, test = split_entities_by_window(sample_deals, window)
-        # All returned entities should have dates in the correct range
-        for deal in train:
-            d = date.fromisoformat(deal.campaign_date)
-            assert date(2016, 1, 1) <= d <= date(2018, 12, 31)
-        for deal in test:
-            d = date.fromisoformat(deal.campaign_date)
-            assert date(2019, 1, 1) <= d <= date(2019, 12, 31)
+
+        # Independent oracle: the same inclusive range checks as datetime64 masks
+        dates = np.array([d.campaign_date for d in sample_deals], dtype="datetime64[D]")
+        ids = np.array([d.entity_id for d in sample_deals])
+        in_train = (dates >= np.datetime64(window.train_start)) & (
+            dates <= np.datetime64(window.train_end)
+        )
+        in_test = (dates >= np.datetime64(window.test_start)) & (
+            dates <= np.datetime64(window.test_end)
+        )
+
+        assert [d.entity_id for d in train] == ids[in_train].tolist()
+        assert [d.entity_id for d in test] == ids[in_test].tolist()
+        assert train
+        assert test